@@ -37,24 +37,35 @@ def main(cmd_args: Sequence[str], prog_path: str, entry_name: str) -> int:
     return 0
 
 
-def compute_working_tree(ephemeral: bool) -> str:
+def compute_working_tree(
+    ephemeral: bool, *, cwd: str | os.PathLike[str] | None = None
+) -> str:
     """Compute the Git tree hash for the current working directory.
 
     :param bool ephemeral: When ``True``, use a temporary object database and do
         not store objects in the repository object database.
+    :param cwd: Directory inside the working tree to run git in, instead of the
+        current working directory.
+    :type cwd: str | os.PathLike[str] | None
     :returns: The computed tree hash.
     :rtype: str
     """
-    porcelain = _run_git(["status", "--porcelain", "--ignore-submodules=dirty"]).strip()
+    porcelain = _run_git(
+        ["status", "--porcelain", "--ignore-submodules=dirty"], cwd=cwd
+    ).strip()
     if porcelain == "":
-        return _run_git(["write-tree"]).strip()
+        return _run_git(["write-tree"], cwd=cwd).strip()
 
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_dir_path = Path(temp_dir)
         tmp_index_path = temp_dir_path / "tmp_index"
         tmp_index_path.touch()
 
-        real_index = _run_git(["rev-parse", "--git-path", "index"]).strip()
+        # git prints these paths relative to the directory it ran in
+        base_dir = os.getcwd() if cwd is None else os.fspath(cwd)
+        real_index = os.path.join(
+            base_dir, _run_git(["rev-parse", "--git-path", "index"], cwd=cwd).strip()
+        )
         if os.path.isfile(real_index):
             shutil.copy2(real_index, tmp_index_path)
 
@@ -62,15 +73,17 @@ def compute_working_tree(ephemeral: bool) -> str:
         env_with_index = {**base_env, "GIT_INDEX_FILE": str(tmp_index_path)}
 
         if not ephemeral:
-            return _add_and_write_tree(env_with_index)
+            return _add_and_write_tree(env_with_index, cwd)
 
-        gitdir = _run_git(["rev-parse", "--git-dir"]).strip()
+        gitdir = os.path.join(
+            base_dir, _run_git(["rev-parse", "--git-dir"], cwd=cwd).strip()
+        )
         env_ephemeral = {
             **env_with_index,
             "GIT_OBJECT_DIRECTORY": temp_dir,
             "GIT_ALTERNATE_OBJECT_DIRECTORIES": os.path.join(gitdir, "objects"),
         }
-        return _add_and_write_tree(env_ephemeral)
+        return _add_and_write_tree(env_ephemeral, cwd)
 
 
 def _get_parser(prog_name: str) -> ArgumentParser:
@@ -99,20 +112,27 @@ def _get_parser(prog_name: str) -> ArgumentParser:
     return parser
 
 
-def _run_git(args: list[str], env: dict[str, str] | None = None) -> str:
+def _run_git(
+    args: list[str],
+    env: dict[str, str] | None = None,
+    cwd: str | os.PathLike[str] | None = None,
+) -> str:
     completed = subprocess.run(
         ["git", *args],
         check=True,
         capture_output=True,
         env=env,
         text=True,
+        cwd=cwd,
     )
     return completed.stdout
 
 
-def _add_and_write_tree(env: dict[str, str]) -> str:
-    _run_git(["add", "-A"], env=env)
-    return _run_git(["write-tree"], env=env).strip()
+def _add_and_write_tree(
+    env: dict[str, str], cwd: str | os.PathLike[str] | None = None
+) -> str:
+    _run_git(["add", "-A"], env=env, cwd=cwd)
+    return _run_git(["write-tree"], env=env, cwd=cwd).strip()
 
 
 if __name__ == "__main__":
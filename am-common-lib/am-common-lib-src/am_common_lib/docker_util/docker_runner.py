@@ -141,6 +141,13 @@ class DockerRunner:
         :return: A user-scoped view bound to the default container user.
         :rtype: DockerRunnerUserView
         """
+        # One exec resolves both; pwd already yields the canonical working directory.
+        res = self.run(["sh", "-c", "id -un && pwd"], text=True)
+        lines = res.stdout.splitlines()
+        if res.returncode == 0 and len(lines) == 2:
+            default_user, workdir = lines
+            return DockerRunnerUserView(self, default_user, workdir, _cwd_resolved=True)
+        # No `sh` in the image, or unexpected output: resolve each on its own
         default_user = self.run(["id", "-un"], text=True).stdout.strip()
         workdir = self.run(["pwd"], text=True).stdout.strip()
         return DockerRunnerUserView(self, default_user, workdir)
@@ -225,12 +232,18 @@ class DockerRunner:
         return subprocess.run(cp_command, capture_output=True, check=True, text=True)
 
     def copy_to(
-        self, src_path: str | Path | Sequence[str | Path], dest_path: str
+        self,
+        src_path: str | Path | Sequence[str | Path],
+        dest_path: str,
+        *,
+        cwd: str | Path | None = None,
     ) -> subprocess.CompletedProcess[str]:
         """Copy a file or folder into the container via ``docker cp``.
 
         :param str|Path|Sequence[str|Path] src_path: Local source path(s).
         :param str dest_path: Destination path inside the container.
+        :param str|Path|None cwd: Host directory that relative sources are resolved
+            against, instead of the current working directory.
         :return: Completed process result.
         :rtype: subprocess.CompletedProcess[str]
         """
@@ -243,7 +256,7 @@ class DockerRunner:
         cmd.extend(sources)
         cmd.append(f"{self.container_name}:{dest_path}")
 
-        return subprocess.run(cmd, capture_output=True, text=True, check=True)
+        return subprocess.run(cmd, capture_output=True, text=True, check=True, cwd=cwd)
 
     def open(
         self,
@@ -322,13 +335,23 @@ class DockerRunnerUserView:
     :type workdir: str | None
     """
 
-    def __init__(self, base: DockerRunner, username: str, workdir: str | None = None):
+    def __init__(
+        self,
+        base: DockerRunner,
+        username: str,
+        workdir: str | None = None,
+        *,
+        _cwd_resolved: bool = False,
+    ):
         self._base = base
         self._username = username
         self._cwd: str
 
-        # Validate user and get working directory
-        if workdir is None:
+        # Validate user and get working directory; only default_view, which
+        # has just read workdir from the container, skips the validation
+        if _cwd_resolved and workdir is not None:
+            self._cwd = workdir
+        elif workdir is None:
             self._cwd = self._base.get_home_dir(username)
         else:
             result = self._base.run(
@@ -8,6 +8,10 @@ import string
 import zlib
 
 
+_DISALLOWED_NAME_CHARS_RE = re.compile(r"[^A-Za-z0-9_.-]+")
+_ALNUM_START_RE = re.compile(r"^[A-Za-z0-9]")
+
+
 @dataclass(frozen=True)
 class ImageNames:
     """Canonical Docker image names used across tests."""
@@ -60,6 +64,29 @@ def to_base_54(token: bytes) -> str:
     return "".join(reversed(result))
 
 
+def from_base_54(encoded: str, length: int) -> bytes:
+    """Decode a string produced by :func:`to_base_54` back into ``length`` bytes.
+
+    The encoding does not preserve leading zero bytes, so the original length has
+    to be supplied, as with :meth:`int.to_bytes`.
+
+    :param str encoded: A base-54 string as returned by :func:`to_base_54`.
+    :param int length: Number of bytes of the original token.
+    :return: The decoded token.
+    :rtype: bytes
+    :raises ValueError: If ``encoded`` contains a character outside the alphabet.
+    :raises OverflowError: If the decoded value does not fit into ``length`` bytes.
+    """
+    index = _charset_index()
+    num = 0
+    for char in encoded:
+        try:
+            num = num * len(index) + index[char]
+        except KeyError:
+            raise ValueError(f"Invalid base-54 character: {char!r}") from None
+    return num.to_bytes(length, "big")
+
+
 @functools.lru_cache(maxsize=10)
 def get_container_name_base(img_name: str, max_length: int | None = None) -> str:
     """Get a prefix for Docker container names based on the image name.
@@ -75,8 +102,8 @@ def get_container_name_base(img_name: str, max_length: int | None = None) -> str
     :rtype: str
     :raises ValueError: If ``max_length`` is provided and less than 2.
     """
-    sanitized_base = re.sub(r"[^A-Za-z0-9_.-]+", "_", img_name)
-    if not re.match(r"^[A-Za-z0-9]", sanitized_base):
+    sanitized_base = _DISALLOWED_NAME_CHARS_RE.sub("_", img_name)
+    if not _ALNUM_START_RE.match(sanitized_base):
         hash_val = zlib.crc32(img_name.encode("utf-8"))
         alnum = string.ascii_letters + string.digits
         prefix_char = alnum[hash_val % len(alnum)]
@@ -97,3 +124,8 @@ def _generate_charset() -> tuple[str, ...]:
     return tuple(
         sorted(c for c in string.digits + string.ascii_letters if c not in ambiguous)
     )
+
+
+@cache
+def _charset_index() -> dict[str, int]:
+    return {c: i for i, c in enumerate(_generate_charset())}
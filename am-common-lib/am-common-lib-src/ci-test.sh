@@ -16,6 +16,14 @@ require_clean() {
   fi
 }
 
+# A working-tree snapshot commit is only referenced from refs/ci-working-tree/,
+# which a clone does not copy; fetch that namespace when the commit is missing.
+fetch_ci_commit() {
+  if ! git cat-file -e "${CI_COMMIT}^{commit}" 2>/dev/null; then
+    git fetch origin '+refs/ci-working-tree/*:refs/ci-working-tree/*'
+  fi
+}
+
 # -----------------------------------------------------------------------------
 # Pre‑flight checks
 # -----------------------------------------------------------------------------
@@ -42,6 +50,7 @@ CI_COMMIT="${1:?Error: a commit hash argument is required.}"
 
 git clone "file://${REPO_ROOT}" /home/dockeruser/git_repos/dev-bootstrap
 cd ~/git_repos/dev-bootstrap
+fetch_ci_commit
 git checkout "$CI_COMMIT"
 
 COMMIT=$(git rev-parse HEAD)
@@ -70,6 +79,7 @@ echo "==> Running packaging tests..."
 PKG_TEST_REPO=~/git_repos/am-common-lib-pkg-test
 git clone "file://${REPO_ROOT}" "$PKG_TEST_REPO"
 cd "$PKG_TEST_REPO"
+fetch_ci_commit
 git checkout "$CI_COMMIT"
 
 # Build the package following the steps documented in README.md
@@ -0,0 +1,105 @@
+import importlib.util
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+from types import ModuleType
+
+from assertpy import assert_that
+import pytest
+
+
+# The scripts run on the host as installed: standalone, next to their sibling module
+_SCRIPTS_DIR = Path(__file__).resolve().parents[3] / "devenv" / "scripts"
+
+
+def _run_script(
+    name: str, *args: str, env: dict[str, str] | None = None
+) -> subprocess.CompletedProcess[bytes]:
+    return subprocess.run(
+        [sys.executable, str(_SCRIPTS_DIR / name), *args],
+        capture_output=True,
+        check=False,
+        env=env,
+    )
+
+
+def _load_dedupe_path() -> ModuleType:
+    spec = importlib.util.spec_from_file_location(
+        "dedupe_path", _SCRIPTS_DIR / "dedupe_path.py"
+    )
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_cli_echo() -> None:
+    res = _run_script("cli_echo.py", "plain", "ünïcode")
+    assert_that(res.returncode).is_equal_to(0)
+    # UTF-8 as is, not \u-escaped, and indented
+    assert_that(res.stdout).contains("ünïcode".encode())
+    assert_that(res.stdout[:5]).is_equal_to(b'{\n  "')
+    info = json.loads(res.stdout)
+    assert_that(info).contains_only(
+        "cwd", "args", "user", "user_home_dir", "is_root", "os_name", "python"
+    )
+    assert_that(info["args"]).is_equal_to(["plain", "ünïcode"])
+    assert_that(info["python"]["python_executable"]).is_equal_to(sys.executable)
+
+
+def test_cli_echo_help() -> None:
+    res = _run_script("cli_echo.py", "--help")
+    assert_that(res.returncode).is_equal_to(0)
+    assert_that(json.loads(res.stdout)["help"]).contains("JSON snapshot")
+
+
+def test_cli_echo_all() -> None:
+    env = {**os.environ, "CLI_ECHO_TEST_VAR": "välue"}
+    res = _run_script("cli_echo_all.py", "arg", env=env)
+    assert_that(res.returncode).is_equal_to(0)
+    info = json.loads(res.stdout)
+    assert_that(info["args"]).is_equal_to(["arg"])
+    assert_that(info["process_id"]).is_instance_of(int)
+    assert_that(info["environment_variables"]).contains_entry(
+        {"CLI_ECHO_TEST_VAR": "välue"}
+    )
+    assert_that(info["platform"]).contains_key("system", "machine", "release")
+
+
+@pytest.mark.skipif(not os.supports_bytes_environ, reason="needs a bytes environment")
+def test_cli_echo_all_escapes_undecodable_environment() -> None:
+    env = {**os.environb, b"CLI_ECHO_TEST_VAR": b"\xff"}
+    res = subprocess.run(
+        [sys.executable, str(_SCRIPTS_DIR / "cli_echo_all.py")],
+        capture_output=True,
+        check=False,
+        env=env,
+    )
+    assert_that(res.returncode).is_equal_to(0)
+    variables = json.loads(res.stdout)["environment_variables"]
+    assert_that(variables["CLI_ECHO_TEST_VAR"]).is_equal_to("\udcff")
+
+
+@pytest.mark.parametrize(
+    ("path", "allow_relative", "expected"),
+    [
+        ("/a:/b:/a:rel:/b:rel", True, "/a:/b:rel"),
+        ("/a:/b:/a:rel:/b:rel", False, "/a:/b"),
+        ("", True, ""),
+    ],
+)
+def test_de_dupe(path: str, allow_relative: bool, expected: str) -> None:
+    de_dupe = _load_dedupe_path().de_dupe
+    assert_that(de_dupe(path, allow_relative=allow_relative)).is_equal_to(expected)
+
+
+def test_dedupe_path_script() -> None:
+    res = _run_script("dedupe_path.py", "/usr/bin:/bin:/usr/bin")
+    assert_that(res.returncode).is_equal_to(0)
+    assert_that(res.stdout).is_equal_to(b"/usr/bin:/bin\n")
+
+    res = _run_script("dedupe_path.py")
+    assert_that(res.returncode).is_equal_to(1)
+    assert_that(res.stdout).is_empty()
@@ -1,8 +1,6 @@
 from collections.abc import Generator
-from collections.abc import Sequence
 from dataclasses import dataclass
 from functools import cache
-from functools import lru_cache
 import hashlib
 import os
 from pathlib import Path
@@ -12,6 +10,7 @@ import shlex
 import subprocess
 from subprocess import CompletedProcess
 import tempfile
+from typing import Final
 
 from assertpy import assert_that
 from assertpy import soft_assertions
@@ -45,6 +44,18 @@ _GIT_COMPLETION_PREFIXES: tuple[str, ...] = (
     "_get_comp_words_by_ref",
 )
 
+# Every resource the container tests use, read once at import so that none of
+# them (or their parametrized cases) goes back to ``importlib.resources``.
+_RESOURCE_SCRIPTS: Final[dict[tuple[str, str], str]] = {
+    (pkg, res): resource_utils.read_resource_text(pkg, res)
+    for pkg, res in (
+        ("resources", "get_command_list.sh"),
+        ("resources", "get_aliases.sh"),
+        ("resources", "get_shell_functions.sh"),
+        ("resources", "inspect_symlink.sh"),
+    )
+}
+
 _SHORTCUT_TO_GIT_SUBCOMMAND: list[tuple[str, str]] = [
     ("ga", "add"),
     ("gb", "branch"),
@@ -81,9 +92,9 @@ def test_symbols_do_not_collide_with_existing(
     _initialized_container_ro: ViewAndCheckedOutRepo,
 ) -> None:
     user_view = _initialized_container_ro.user_view
-    orig_executables = set(_get_executables_in_path(user_view))
-    orig_aliases = set(_get_aliases_in_session(user_view))
-    orig_functions = set(_get_functions_in_session(user_view))
+    orig_executables = _get_executables_in_path(user_view)
+    orig_aliases = _get_aliases_in_session(user_view)
+    orig_functions = _get_functions_in_session(user_view)
 
     with soft_assertions():
         assert_that(
@@ -101,9 +112,9 @@ def test_installed_symbols_are_accounted_for(
     initialized_container: ViewAndCheckedOutRepo,
 ) -> None:
     user_view = initialized_container.user_view
-    orig_executables = set(_get_executables_in_path(user_view))
-    orig_aliases = set(_get_aliases_in_session(user_view))
-    orig_functions = set(_get_functions_in_session(user_view))
+    orig_executables = _get_executables_in_path(user_view)
+    orig_aliases = _get_aliases_in_session(user_view)
+    orig_functions = _get_functions_in_session(user_view)
 
     container_tgt_file = "/home/basicuser/.bashrc"
     _run_install(initialized_container, container_tgt_file)
@@ -139,9 +150,9 @@ def test_intended_symbols_are_installed(
     initialized_container: ViewAndCheckedOutRepo,
 ) -> None:
     user_view = initialized_container.user_view
-    orig_executables = set(_get_executables_in_path(user_view))
-    orig_aliases = set(_get_aliases_in_session(user_view))
-    orig_functions = set(_get_functions_in_session(user_view))
+    orig_executables = _get_executables_in_path(user_view)
+    orig_aliases = _get_aliases_in_session(user_view)
+    orig_functions = _get_functions_in_session(user_view)
     container_tgt_file = "/home/basicuser/.bashrc"
     _run_install(initialized_container, container_tgt_file)
     final_new_executables = {
@@ -201,8 +212,9 @@ def test_full_installation(
 @pytest.mark.parametrize("shortcut", INSTALLABLE_EXECUTABLES)
 def test_sym_links(installed_container_ro: DockerRunnerUserView, shortcut: str) -> None:
     # Assert that the symlink is not broken, that the target is executable.
+    inspect_symlink_src = _RESOURCE_SCRIPTS[("resources", "inspect_symlink.sh")]
     res = installed_container_ro.run(
-        ["bash", "-ic", f"{_inspect_symlink_src()}\ninspect_symlink {shortcut}"],
+        ["bash", "-ic", f"{inspect_symlink_src}\ninspect_symlink {shortcut}"],
         exec_args=["-t"],
         text=True,
     )
@@ -233,48 +245,43 @@ def test_bash_completion_registered(
         )
 
 
-def _get_executables_in_path(user_view: DockerRunnerUserView) -> Sequence[str]:
+def _get_executables_in_path(user_view: DockerRunnerUserView) -> frozenset[str]:
     result: CompletedProcess[str] = user_view.run(
         [
             "bash",
             "-ic",
-            _cached_read_resource_text("resources", "get_command_list.sh"),
+            _RESOURCE_SCRIPTS[("resources", "get_command_list.sh")],
         ],
         exec_args=["-t"],
         text=True,
     )
-    return result.stdout.split("\n")
+    return frozenset(filter(None, result.stdout.splitlines()))
 
 
-def _get_aliases_in_session(user_view: DockerRunnerUserView) -> Sequence[str]:
+def _get_aliases_in_session(user_view: DockerRunnerUserView) -> frozenset[str]:
     result: CompletedProcess[str] = user_view.run(
         [
             "bash",
             "-ic",
-            _cached_read_resource_text("resources", "get_aliases.sh"),
+            _RESOURCE_SCRIPTS[("resources", "get_aliases.sh")],
         ],
         exec_args=["-t"],
         text=True,
     )
-    return result.stdout.split("\n")
+    return frozenset(filter(None, result.stdout.splitlines()))
 
 
-def _get_functions_in_session(user_view: DockerRunnerUserView) -> Sequence[str]:
+def _get_functions_in_session(user_view: DockerRunnerUserView) -> frozenset[str]:
     result: CompletedProcess[str] = user_view.run(
         [
             "bash",
             "-ic",
-            _cached_read_resource_text("resources", "get_shell_functions.sh"),
+            _RESOURCE_SCRIPTS[("resources", "get_shell_functions.sh")],
         ],
         exec_args=["-t"],
         text=True,
     )
-    return result.stdout.split("\n")
-
-
-@lru_cache(maxsize=10)
-def _cached_read_resource_text(package: str, resource: str) -> str:
-    return resource_utils.read_resource_text(package, resource)
+    return frozenset(filter(None, result.stdout.splitlines()))
 
 
 @cache
@@ -307,7 +314,11 @@ def _run_install(
     view_and_checked_out_repo.checked_out_repo_path / "devenv" / "install.py"
     r = view_and_checked_out_repo.user_view.run(
         [
+            # install.py only needs the standard library: skip site initialization
+            # and .pyc writes on every invocation.
             "python3",
+            "-S",
+            "-B",
             (
                 view_and_checked_out_repo.checked_out_repo_path
                 / "devenv"
@@ -325,14 +336,13 @@ def _run_install(
         assert_that(r.stderr).described_as("stderr").is_empty()
 
 
-@cache
-def _inspect_symlink_src() -> str:
-    return resource_utils.read_resource_text("resources", "inspect_symlink.sh")
+def _get_toplevel(for_path: str | os.PathLike[str]) -> Path:
+    """Get the git top-level (or root) for the file or folder 'for_path'."""
+    return _get_toplevel_cached(os.fspath(for_path))
 
 
 @cache
-def _get_toplevel(for_path: str | os.PathLike[str]) -> Path:
-    """Get the git top-level (or root) for the file or folder 'for_path'."""
+def _get_toplevel_cached(for_path: str) -> Path:
     r: CompletedProcess[str] = subprocess.run(
         ["git", "rev-parse", "--show-toplevel"],
         cwd=str(os.path.dirname(for_path)),
@@ -348,8 +358,10 @@ def _commit_current_working_tree(git_path: str) -> str:
     """Returns a *commit* that is guaranteed to point to a tree identical to the current
     working tree, without checking it out or disturbing the state of the working tree or
     index."""
+    # With --branch, porcelain v2 also reports the HEAD commit ("# branch.oid"), so a
+    # clean tree needs no further git invocation.
     porcelain_status = subprocess.run(
-        ["git", "status", "--porcelain"],
+        ["git", "status", "--porcelain=v2", "--branch"],
         check=False,
         cwd=git_path,
         text=True,
@@ -360,34 +372,31 @@ def _commit_current_working_tree(git_path: str) -> str:
         raise RuntimeError(
             f"fatal: not a git repository. Command response: {porcelain_status}"
         )
-    if not porcelain_status.stdout.strip():
+    status_lines = porcelain_status.stdout.splitlines()
+    head_commit = next(
+        (
+            line.removeprefix("# branch.oid ")
+            for line in status_lines
+            if line.startswith("# branch.oid ")
+        ),
+        "(initial)",
+    )
+    # "(initial)" means HEAD is an unborn branch: there is no commit yet
+    head_exists = head_commit != "(initial)"
+    if all(line.startswith("#") for line in status_lines):
         # Working tree is clean, so do not create a new commit
-        print(f"Stdout consists of {porcelain_status.stdout}")
-        return subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            cwd=git_path,
-            text=True,
-            capture_output=True,
-            check=True,
-        ).stdout.strip()
+        if not head_exists:
+            raise RuntimeError(
+                f"Clean working tree without any commit at HEAD in {git_path}"
+            )
+        return head_commit
 
     with tempfile.TemporaryDirectory() as tmp_dir:
         tmp_index_path = os.path.join(tmp_dir, "git-index")
-        open(tmp_index_path, "w").close()
         env = os.environ.copy()
         env["GIT_INDEX_FILE"] = tmp_index_path
 
         # Seed the index from HEAD if it exists
-        head_exists = (
-            subprocess.run(
-                ["git", "rev-parse", "--verify", "HEAD"],
-                check=False,
-                cwd=git_path,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            ).returncode
-            == 0
-        )
         if head_exists:
             subprocess.run(
                 ["git", "read-tree", "HEAD"],
@@ -475,12 +484,20 @@ def _construct_initialized_container() -> Generator[ViewAndCheckedOutRepo]:
 
 def _calculate_mount_args(
     repo_to_mount: str | os.PathLike[str], container_base_path: PurePosixPath
-) -> tuple[Sequence[str], PurePosixPath]:
+) -> tuple[tuple[str, ...], PurePosixPath]:
     """
     Returns:
       - extra_args: Docker -v args to mount the minimal host dir (read-only)
       - container_repo_path: absolute path INSIDE the container where the repo lives
     """
+    # Cached on the fspath, so that a str and a Path to the same repo share an entry
+    return _calculate_mount_args_cached(os.fspath(repo_to_mount), container_base_path)
+
+
+@cache
+def _calculate_mount_args_cached(
+    repo_to_mount: str, container_base_path: PurePosixPath
+) -> tuple[tuple[str, ...], PurePosixPath]:
     repo = Path(repo_to_mount).expanduser().resolve(strict=True)
 
     host_root = _get_root_to_mount(repo)
@@ -531,6 +548,11 @@ def _get_root_to_mount(repo_to_mount: str | os.PathLike[str]) -> Path:
     Handles submodules (where .git is a file pointing elsewhere) by resolving that
     gitdir and returning the deepest common ancestor.
     """
+    return _get_root_to_mount_cached(os.fspath(repo_to_mount))
+
+
+@cache
+def _get_root_to_mount_cached(repo_to_mount: str) -> Path:
     repo = Path(repo_to_mount).expanduser().resolve(strict=True)
     git_entry = repo / ".git"
     if not git_entry.exists():
@@ -541,10 +563,10 @@ def _get_root_to_mount(repo_to_mount: str | os.PathLike[str]) -> Path:
         git_dir = git_entry.resolve(strict=True)
     else:
         # read "gitdir: <path>"
-        first = git_entry.read_text(encoding="utf-8").splitlines()[0].strip()
-        if not first.startswith("gitdir:"):
-            raise ValueError(f"Unexpected format in {git_entry}: {first!r}")
-        path_ref = first[len("gitdir:") :].strip()
+        key, sep, rest = git_entry.read_text(encoding="utf-8").partition(":")
+        if not sep or key.strip() != "gitdir":
+            raise ValueError(f"Unexpected format in {git_entry}: {key!r}")
+        path_ref = rest.partition("\n")[0].strip()
         git_path = Path(path_ref)
         git_dir = (git_path if git_path.is_absolute() else (repo / git_path)).resolve(
             strict=True
@@ -10,24 +10,34 @@ from __future__ import annotations
 import argparse
 from argparse import ArgumentParser
 from collections import defaultdict
-from collections import deque
+from collections.abc import Mapping
 from collections.abc import Sequence
+from concurrent.futures import FIRST_EXCEPTION
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
 from dataclasses import dataclass
 from datetime import datetime
 from datetime import timezone
+from functools import cache
 import hashlib
+import importlib.util
 import json
+import mmap
 import os
 import os.path
 from pathlib import Path
+from pathlib import PurePath
 from pathlib import PurePosixPath
 import shlex
+import shutil
 import subprocess
 import sys
 import tarfile
 import tempfile
 import time
-from typing import Final, TextIO
+from types import MappingProxyType
+from types import ModuleType
+from typing import BinaryIO, Final
 
 
 # Python 3.9 compatibility: UTC was added in Python 3.11
@@ -37,23 +47,26 @@ except ImportError:
     UTC = timezone.utc  # noqa: UP017
 
 
+_MODULE_ROOT: Final[Path] = Path(__file__).resolve().parents[1]
 MOUNTED_BASE_PATH: Final[PurePosixPath] = PurePosixPath("/home/dockeruser/src-git")
-DOCKER_IMAGES_DIR: Final[Path] = (
-    Path(__file__).resolve().parents[1] / "test" / "resources" / "docker-images"
-)
+DOCKER_IMAGES_DIR: Final[Path] = _MODULE_ROOT / "test" / "resources" / "docker-images"
 CI_SCRIPT_REL_PATH: Final[PurePosixPath] = PurePosixPath("ci-test")
 CONTAINER_REPO_CLONE_DIR: Final[PurePosixPath] = PurePosixPath(
     "/home/dockeruser/git_repos/dev-bootstrap/am-common-lib/am-common-lib-src"
 )
 UV_CACHE_CONTAINER_PATH: Final[str] = "/home/dockeruser/.cache/uv"
 UV_DATA_CONTAINER_PATH: Final[str] = "/home/dockeruser/.local/share/uv"
-_CI_TEMP_REF: Final[str] = "refs/heads/__ci_working_tree__"
+_VOLUME_OWNERSHIP_MARKER: Final[str] = ".dockeruser-owned"
+# Outside refs/heads, so a run killed before its cleanup leaves no visible branch
+_CI_TEMP_REF_NAMESPACE: Final[str] = "refs/ci-working-tree/"
+# Longer than any CI run: only refs of runs that never cleaned up are this old
+_STALE_TEMP_REF_AGE_MS: Final[int] = 24 * 60 * 60 * 1000
+# Docker Desktop honours the ``cached`` consistency hint; Linux ignores it.
+_BIND_MOUNT_OPTIONS: Final[str] = (
+    "ro,cached" if sys.platform in ("darwin", "win32") else "ro"
+)
 GIT_WRITE_WORKING_TREE_SCRIPT: Final[Path] = (
-    Path(__file__).resolve().parents[1]
-    / "_devtools"
-    / "src"
-    / "_devtools"
-    / "git_write_working_tree.py"
+    _MODULE_ROOT / "_devtools" / "src" / "_devtools" / "git_write_working_tree.py"
 )
 
 
@@ -86,19 +99,25 @@ def main(cmd_args: Sequence[str], prog_path: str) -> None:
     parsed_args = parser.parse_args(cmd_args)
 
     repo_root = _resolve_repo_root()
-    _ensure_prerequisites()
-
-    ci_commit, _, needs_ref_cleanup = _capture_working_tree_commit(repo_root)
-
     project_id = _compute_project_identity()
     container_name = parsed_args.container_name or project_id
     dind_volume = f"{project_id}_lib_docker"
     uv_cache_volume = f"{project_id}_uv_cache"
     uv_data_volume = f"{project_id}_uv_data"
 
-    _ensure_volume_exists(dind_volume)
-    _ensure_volume_exists(uv_cache_volume)
-    _ensure_volume_exists(uv_data_volume)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        startup_checks = [
+            executor.submit(_ensure_prerequisites),
+            *(
+                executor.submit(_ensure_volume_exists, volume)
+                for volume in (dind_volume, uv_cache_volume, uv_data_volume)
+            ),
+        ]
+        for startup_check in startup_checks:
+            startup_check.result()
+
+    ci_commit, _, temp_ref = _capture_working_tree_commit(repo_root)
+
     _build_host_dind_image()
 
     mounting_args = calculate_mounting_args(repo_root, MOUNTED_BASE_PATH)
@@ -115,8 +134,8 @@ def main(cmd_args: Sequence[str], prog_path: str) -> None:
             ci_commit=ci_commit,
         )
     finally:
-        if needs_ref_cleanup:
-            _cleanup_temp_ref(repo_root)
+        if temp_ref is not None:
+            _cleanup_temp_ref(repo_root, temp_ref)
 
 
 def calculate_mounting_args(
@@ -181,6 +200,7 @@ def _get_parser(prog_name: str) -> ArgumentParser:
     return parser
 
 
+@cache
 def _resolve_repo_root() -> Path:
     """Resolve repository root from git metadata."""
     proc = _run_checked(
@@ -190,58 +210,73 @@ def _resolve_repo_root() -> Path:
     return Path(proc.stdout.strip()).resolve()
 
 
+@cache
 def _compute_project_identity() -> str:
     """Compute a deterministic container name from the project folder path.
 
     :return: Container name in the form ``{folder_name}_{short_hash}``.
     :rtype: str
     """
-    project_dir = Path(__file__).resolve().parents[1]
-    path_hash = hashlib.blake2b(str(project_dir).encode(), digest_size=4).hexdigest()
-    return f"{project_dir.name}_{path_hash}"
+    path_hash = hashlib.blake2b(str(_MODULE_ROOT).encode(), digest_size=4).hexdigest()
+    return f"{_MODULE_ROOT.name}_{path_hash}"
+
+
+@cache
+def _git_write_working_tree() -> ModuleType:
+    """Load the ``git_write_working_tree`` helper from its file.
 
+    It is loaded on first use, by path, so that importing this script neither
+    touches ``sys.path`` nor depends on ``_devtools`` being present.
 
-def _capture_working_tree_commit(repo_root: Path) -> tuple[str, int, bool]:
+    :return: The loaded helper module.
+    :rtype: ModuleType
+    """
+    spec = importlib.util.spec_from_file_location(
+        "git_write_working_tree", GIT_WRITE_WORKING_TREE_SCRIPT
+    )
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Cannot load {GIT_WRITE_WORKING_TREE_SCRIPT}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _capture_working_tree_commit(repo_root: Path) -> tuple[str, int, str | None]:
     """Obtain a commit whose tree matches the current working directory state.
 
-    Runs ``git_write_working_tree.py`` to compute the tree hash that
+    Uses ``git_write_working_tree`` to compute the tree hash that
     represents all tracked content (including uncommitted changes), then
     records ``unix_time_ms``.  If HEAD already points at this tree the
     HEAD commit is returned; otherwise a new commit object is created
-    with ``git commit-tree`` and a temporary branch ref is created so
-    that the commit is reachable during ``git clone file://...``.
+    with ``git commit-tree`` and a temporary ref is created under
+    ``refs/ci-working-tree/`` so that the commit can be fetched from the
+    clone made by ``ci-test``.  The ref name is unique per run, so concurrent
+    runs sharing a git directory do not overwrite each other's ref; refs
+    left behind by earlier runs that were killed are pruned first.
 
     :param Path repo_root: Repository root directory.
-    :return: ``(commit_hash, unix_time_ms, needs_ref_cleanup)``.
-    :rtype: tuple[str, int, bool]
+    :return: ``(commit_hash, unix_time_ms, temp_ref)``, where ``temp_ref`` is
+        ``None`` when no ref was created.
+    :rtype: tuple[str, int, str | None]
     """
-    tree_hash = subprocess.run(
-        [sys.executable, str(GIT_WRITE_WORKING_TREE_SCRIPT)],
-        capture_output=True,
-        text=True,
-        check=True,
-        cwd=str(repo_root),
-    ).stdout.strip()
+    tree_hash = _git_write_working_tree().compute_working_tree(
+        ephemeral=False, cwd=repo_root
+    )
     unix_time_ms = time.time_ns() // 1_000_000
+    _prune_stale_temp_refs(repo_root, unix_time_ms)
 
-    head_tree = subprocess.run(
-        ["git", "rev-parse", "HEAD^{tree}"],
+    # One git process resolves both the commit and its tree
+    head_commit, head_tree = subprocess.run(
+        ["git", "rev-parse", "HEAD", "HEAD^{tree}"],
         capture_output=True,
         text=True,
         check=True,
         cwd=str(repo_root),
-    ).stdout.strip()
+    ).stdout.split()
 
     if head_tree == tree_hash:
-        head_commit = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            capture_output=True,
-            text=True,
-            check=True,
-            cwd=str(repo_root),
-        ).stdout.strip()
         print(f"Working tree matches HEAD ({head_commit}).", flush=True)
-        return head_commit, unix_time_ms, False
+        return head_commit, unix_time_ms, None
 
     commit_hash = subprocess.run(
         [
@@ -259,8 +294,9 @@ def _capture_working_tree_commit(repo_root: Path) -> tuple[str, int, bool]:
         cwd=str(repo_root),
     ).stdout.strip()
 
+    temp_ref = f"{_CI_TEMP_REF_NAMESPACE}{os.getpid()}-{unix_time_ms}"
     subprocess.run(
-        ["git", "update-ref", _CI_TEMP_REF, commit_hash],
+        ["git", "update-ref", temp_ref, commit_hash],
         check=True,
         cwd=str(repo_root),
     )
@@ -269,16 +305,49 @@ def _capture_working_tree_commit(repo_root: Path) -> tuple[str, int, bool]:
         f"Created working-tree commit {commit_hash} (tree {tree_hash}, parent HEAD).",
         flush=True,
     )
-    return commit_hash, unix_time_ms, True
+    return commit_hash, unix_time_ms, temp_ref
+
+
+def _prune_stale_temp_refs(repo_root: Path, now_ms: int) -> None:
+    """Delete temporary refs of runs that were killed before their cleanup.
+
+    A ref name ends in the time its run started, so refs of runs that may
+    still be going on are left alone.
+
+    :param Path repo_root: Repository root directory.
+    :param int now_ms: Current Unix time in milliseconds.
+    """
+    listed = subprocess.run(
+        ["git", "for-each-ref", "--format=%(refname)", _CI_TEMP_REF_NAMESPACE],
+        capture_output=True,
+        text=True,
+        check=False,
+        cwd=str(repo_root),
+    )
+    stale_refs = []
+    for ref in listed.stdout.splitlines():
+        started_ms = ref.rpartition("-")[2]
+        if started_ms.isdigit() and now_ms - int(started_ms) > _STALE_TEMP_REF_AGE_MS:
+            stale_refs.append(ref)
+    if stale_refs:
+        subprocess.run(
+            ["git", "update-ref", "--stdin"],
+            input="".join(f"delete {ref}\n" for ref in stale_refs),
+            text=True,
+            check=False,
+            cwd=str(repo_root),
+            capture_output=True,
+        )
 
 
-def _cleanup_temp_ref(repo_root: Path) -> None:
-    """Delete the temporary branch ref created for CI.
+def _cleanup_temp_ref(repo_root: Path, temp_ref: str) -> None:
+    """Delete the temporary ref created for CI.
 
     :param Path repo_root: Repository root directory.
+    :param str temp_ref: The ref returned by :func:`_capture_working_tree_commit`.
     """
     subprocess.run(
-        ["git", "update-ref", "-d", _CI_TEMP_REF],
+        ["git", "update-ref", "-d", temp_ref],
         check=False,
         cwd=str(repo_root),
         capture_output=True,
@@ -326,9 +395,7 @@ def _run_local_ci(
     uv_data_volume: str,
     ci_commit: str,
 ) -> None:
-    _stop_containers_using_volume(dind_volume)
-    _stop_containers_using_volume(uv_cache_volume)
-    _stop_containers_using_volume(uv_data_volume)
+    _stop_containers_using_volumes(dind_volume, uv_cache_volume, uv_data_volume)
     _remove_container_if_exists(container_name)
 
     with tempfile.TemporaryDirectory() as tempdir:
@@ -363,15 +430,7 @@ def _run_local_ci(
             ]
         )
         _run_checked(
-            [
-                "docker",
-                "exec",
-                container_name,
-                "sh",
-                "-c",
-                "chown -R dockeruser:dockeruser"
-                " /home/dockeruser/.cache /home/dockeruser/.local",
-            ]
+            ["docker", "exec", container_name, "sh", "-c", _claim_uv_volumes_script()]
         )
         try:
             _wait_for_inner_docker(container_name)
@@ -404,6 +463,30 @@ def _run_local_ci(
                 _remove_container_if_exists(container_name)
 
 
+def _claim_uv_volumes_script() -> str:
+    """Return a shell script that hands the uv volumes to ``dockeruser``.
+
+    Docker creates the mount points (and their parents) as root.  The parents
+    are re-owned on every run, which is cheap, but the potentially large volume
+    contents are only traversed by ``chown -R`` the first time; afterwards a
+    marker file inside the volume records that ownership was already fixed.
+    A failure on any volume fails the script, not just one on the last.
+    """
+    parent_dirs = (
+        "/home/dockeruser/.cache",
+        "/home/dockeruser/.local",
+        "/home/dockeruser/.local/share",
+    )
+    volume_dirs = (UV_CACHE_CONTAINER_PATH, UV_DATA_CONTAINER_PATH)
+    return (
+        f"chown dockeruser:dockeruser {shlex.join(parent_dirs)}"
+        f" && for dir in {shlex.join(volume_dirs)}; do"
+        f' if [ ! -e "$dir/{_VOLUME_OWNERSHIP_MARKER}" ]; then'
+        ' chown -R dockeruser:dockeruser "$dir"'
+        f' && touch "$dir/{_VOLUME_OWNERSHIP_MARKER}" || exit 1; fi; done'
+    )
+
+
 def _parse_git_file_target(git_file_path: Path) -> Path:
     """Parse `gitdir: ...` target from a worktree `.git` file."""
     first_line = git_file_path.read_text(encoding="utf-8").splitlines()[0].strip()
@@ -427,7 +510,14 @@ def _resolve_true_git_dir(git_repo_path: Path) -> Path:
 
 def _common_ancestor(path1: Path, path2: Path) -> Path:
     """Find the common ancestor path for two locations."""
-    return Path(os.path.commonpath([str(path1), str(path2)]))
+    common_parts: list[str] = []
+    for part1, part2 in zip(path1.parts, path2.parts):
+        if part1 != part2:
+            break
+        common_parts.append(part1)
+    if not common_parts:
+        raise ValueError(f"No common ancestor for {path1} and {path2}")
+    return Path(*common_parts)
 
 
 def _run_checked(
@@ -442,8 +532,13 @@ def _run_checked(
     )
 
 
-def _active_image_build_plan(docker_images_root: Path) -> list[tuple[str, Path]]:
-    """Return active image names and directories in dependency order."""
+@cache
+def _active_image_build_plan(docker_images_root: Path) -> tuple[tuple[str, Path], ...]:
+    """Return active image names and directories in dependency order.
+
+    The image definitions do not change during a run, so the plan is computed
+    once per root and shared between callers.
+    """
     if not docker_images_root.is_dir():
         raise RuntimeError(
             f"Docker image directory does not exist: {docker_images_root}"
@@ -455,32 +550,44 @@ def _active_image_build_plan(docker_images_root: Path) -> list[tuple[str, Path]]
         if not isinstance(image_name, str) or not image_name:
             raise RuntimeError(f"Invalid image_name in {image_dir / 'image_info.json'}")
         plan.append((image_name, image_dir))
-    return plan
+    return tuple(plan)
 
 
-def _stop_containers_using_volume(volume_name: str) -> None:
-    """Stop and remove any containers that are using the given volume."""
+def _stop_containers_using_volumes(*volume_names: str) -> None:
+    """Stop and remove any containers that are using one of the given volumes.
+
+    Repeated ``volume`` filters are OR'ed by docker, so a single ``docker ps``
+    finds the containers for every volume.
+    """
+    volume_filters = [
+        arg for volume in volume_names for arg in ("--filter", f"volume={volume}")
+    ]
     result = subprocess.run(
-        ["docker", "ps", "-aq", "--filter", f"volume={volume_name}"],
+        ["docker", "ps", "-aq", *volume_filters],
         capture_output=True,
         text=True,
         check=False,
     )
-    if result.returncode != 0 or not result.stdout.strip():
+    if result.returncode != 0:
         return
-    for container_id in result.stdout.strip().splitlines():
-        container_id = container_id.strip()
-        if container_id:
-            print(
-                f"Removing container {container_id} (uses volume {volume_name}).",
-                flush=True,
-            )
-            subprocess.run(
-                ["docker", "rm", "-f", container_id],
-                check=False,
-                capture_output=True,
-                text=True,
-            )
+    container_ids = [
+        container_id.strip()
+        for container_id in result.stdout.splitlines()
+        if container_id.strip()
+    ]
+    if not container_ids:
+        return
+    print(
+        f"Removing containers {', '.join(container_ids)}"
+        f" (use volumes {', '.join(volume_names)}).",
+        flush=True,
+    )
+    subprocess.run(
+        ["docker", "rm", "-f", *container_ids],
+        check=False,
+        capture_output=True,
+        text=True,
+    )
 
 
 def _remove_container_if_exists(container_name: str) -> None:
@@ -513,15 +620,21 @@ def _create_overlay_git_file_if_needed(
 def _create_overlay_ci_script_if_needed(
     repo_root: Path, tempdir_path: Path
 ) -> Path | None:
-    """Create LF-normalized ci-test overlay when CRLF is detected."""
+    """Create LF-normalized ci-test overlay when CRLF is detected.
+
+    The script is scanned through a memory map so the common LF-only case
+    never copies its contents into memory.
+    """
     host_ci_script = repo_root / str(CI_SCRIPT_REL_PATH)
     try:
-        script_content = host_ci_script.read_bytes()
-    except OSError:
+        with host_ci_script.open("rb") as script_file:
+            with mmap.mmap(script_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if mapped.find(b"\r\n") == -1:
+                    return None
+                normalized = mapped[:].replace(b"\r\n", b"\n")
+    except (OSError, ValueError):
+        # ValueError: an empty file cannot be memory-mapped.
         return None
-    if b"\r\n" not in script_content:
-        return None
-    normalized = script_content.replace(b"\r\n", b"\n")
     overlay = tempdir_path / "ci-test-overlay"
     overlay.write_bytes(normalized)
     return overlay
@@ -538,21 +651,24 @@ def _build_mount_args(
     args.extend(
         [
             "-v",
-            f"{mounting_args.worktree.out_path}:{mounting_args.worktree.in_path}:ro",
+            f"{mounting_args.worktree.out_path}:{mounting_args.worktree.in_path}"
+            f":{_BIND_MOUNT_OPTIONS}",
         ]
     )
     if mounting_args.git_dir is not None:
         args.extend(
             [
                 "-v",
-                f"{mounting_args.git_dir.out_path}:{mounting_args.git_dir.in_path}:ro",
+                f"{mounting_args.git_dir.out_path}:{mounting_args.git_dir.in_path}"
+                f":{_BIND_MOUNT_OPTIONS}",
             ]
         )
     if overlay_git_file is not None:
         args.extend(
             [
                 "-v",
-                f"{overlay_git_file}:{mounting_args.worktree.in_path / '.git'}:ro",
+                f"{overlay_git_file}:{mounting_args.worktree.in_path / '.git'}"
+                f":{_BIND_MOUNT_OPTIONS}",
             ]
         )
     if overlay_ci_script is not None:
@@ -560,7 +676,7 @@ def _build_mount_args(
         args.extend(
             [
                 "-v",
-                f"{overlay_ci_script}:{ci_script_target}:ro",
+                f"{overlay_ci_script}:{ci_script_target}:{_BIND_MOUNT_OPTIONS}",
             ]
         )
     return args
@@ -570,6 +686,7 @@ def _wait_for_inner_docker(container_name: str) -> None:
     """Wait until inner Docker daemon in the dind container is ready."""
     print("Waiting for inner Docker daemon to start...", flush=True)
     deadline = time.monotonic() + 90.0
+    interval = 0.1
     while time.monotonic() < deadline:
         result = subprocess.run(
             ["docker", "exec", "-u", "dockeruser", container_name, "docker", "info"],
@@ -580,37 +697,76 @@ def _wait_for_inner_docker(container_name: str) -> None:
         if result.returncode == 0:
             print("Inner Docker daemon is ready.", flush=True)
             return
-        time.sleep(1.0)
+        time.sleep(interval)
+        interval = min(interval * 1.5, 2.0)
     raise RuntimeError("Inner Docker daemon did not become ready in time.")
 
 
 def _build_inner_images(container_name: str, repo_in_container: PurePosixPath) -> None:
-    """Build active non-dind images inside the dind container."""
+    """Build active non-dind images inside the dind container.
+
+    Images in the same dependency layer are built concurrently; a layer is
+    only started once every image of the previous layer has been built.
+    Concurrent builds share the console, so each output line is prefixed with
+    the name of the image it belongs to.
+    """
     docker_images_root_in_container = (
         repo_in_container
         / "am-common-lib/am-common-lib-src/test/resources/docker-images"
     )
-    for image_name, image_dir in _active_image_build_plan(DOCKER_IMAGES_DIR):
-        if image_name == "dind-dev":
-            continue
-        image_dir_in_container = docker_images_root_in_container / image_dir.name
-        print(
-            f"Building inner image: {image_name} ({image_dir_in_container})", flush=True
-        )
-        _run_checked(
-            [
-                "docker",
-                "exec",
-                "-u",
-                "dockeruser",
-                container_name,
-                "docker",
-                "build",
-                "-t",
-                image_name,
-                str(image_dir_in_container),
+    graph = _collect_active_image_graph(DOCKER_IMAGES_DIR)
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for layer in _topological_layers(graph):
+            futures = [
+                executor.submit(
+                    _build_inner_image,
+                    container_name,
+                    image_name,
+                    docker_images_root_in_container
+                    / graph.name_to_dir[image_name].name,
+                )
+                for image_name in layer
+                if image_name != "dind-dev"
             ]
-        )
+            wait(futures, return_when=FIRST_EXCEPTION)
+            for future in futures:
+                future.result()
+
+
+def _build_inner_image(
+    container_name: str, image_name: str, image_dir_in_container: PurePosixPath
+) -> None:
+    """Build a single image inside the dind container.
+
+    :raises subprocess.CalledProcessError: If the build fails.
+    """
+    print(f"Building inner image: {image_name} ({image_dir_in_container})", flush=True)
+    cmd_args = [
+        "docker",
+        "exec",
+        "-u",
+        "dockeruser",
+        container_name,
+        "docker",
+        "build",
+        "-t",
+        image_name,
+        str(image_dir_in_container),
+    ]
+    prefix = f"[{image_name}] ".encode()
+    console = sys.stdout.buffer
+    with subprocess.Popen(
+        cmd_args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+    ) as process:
+        if process.stdout is None:
+            raise RuntimeError("Expected process stdout to be available.")
+        for line in process.stdout:
+            # One write per line: the buffer's lock keeps whole lines together
+            console.write(prefix + line)
+            console.flush()
+        return_code = process.wait()
+    if return_code != 0:
+        raise subprocess.CalledProcessError(return_code, cmd_args)
 
 
 def _stream_ci_output(
@@ -654,11 +810,9 @@ def _stream_ci_output(
         cmd_args,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        text=True,
-        errors="replace",
-        bufsize=1,
+        bufsize=0,
     ) as process:
-        with log_path.open("w", encoding="utf-8", newline="\n") as log_file:
+        with log_path.open("wb") as log_file:
             _tee_process_output(process, log_file)
         return_code = process.wait()
     if return_code != 0:
@@ -687,10 +841,18 @@ def _collect_and_bundle_results(
     :return: Path to the final reports tarball.
     :rtype: Path
     """
-    inner_archive_path = _try_extract_reports_archive(container_name, tempdir_path)
+    staging_dir = tempdir_path / "staging"
+    staging_dir.mkdir(parents=True, exist_ok=True)
+    archive_path_in_container = _get_latest_reports_archive_path(container_name)
+    parsed_archive_name = None
+    if archive_path_in_container is not None and _try_stream_reports_archive(
+        container_name, archive_path_in_container, staging_dir
+    ):
+        parsed_archive_name = _try_parse_inner_archive_name(archive_path_in_container)
     return _assemble_final_reports_bundle(
         repo_root=repo_root,
-        inner_archive_path=inner_archive_path,
+        staging_dir=staging_dir,
+        parsed_archive_name=parsed_archive_name,
         ci_log_path=ci_log_path,
         run_timestamp=run_timestamp,
         ci_passed=ci_passed,
@@ -700,10 +862,11 @@ def _collect_and_bundle_results(
 def _sorted_active_image_dirs(docker_images_root: Path) -> list[Path]:
     """Return active image directories in dependency order."""
     graph = _collect_active_image_graph(docker_images_root)
-    sorted_names = _topological_sort_image_names(
-        graph.name_to_dir, graph.dependencies, graph.reverse_deps
-    )
-    return [graph.name_to_dir[name] for name in sorted_names]
+    return [
+        graph.name_to_dir[name]
+        for layer in _topological_layers(graph)
+        for name in layer
+    ]
 
 
 def _load_image_info(image_info_path: Path) -> dict[str, object]:
@@ -715,52 +878,65 @@ def _load_image_info(image_info_path: Path) -> dict[str, object]:
     return data
 
 
-def _tee_process_output(process: subprocess.Popen[str], log_file: TextIO) -> None:
-    """Write subprocess output to stdout and a log file."""
+def _tee_process_output(process: subprocess.Popen[bytes], log_file: BinaryIO) -> None:
+    """Write subprocess output to stdout and a log file.
+
+    Output is copied as raw chunks, so no per-line decoding or flushing is done.
+    """
     if process.stdout is None:
         raise RuntimeError("Expected process stdout to be available.")
-    for line in iter(process.stdout.readline, ""):
-        try:
-            print(line, end="", flush=True)
-        except UnicodeEncodeError:
-            print(
-                line.encode("ascii", errors="replace").decode("ascii"),
-                end="",
-                flush=True,
-            )
-        log_file.write(line)
-        log_file.flush()
+    stdout_fd = process.stdout.fileno()
+    console = sys.stdout.buffer
+    while chunk := os.read(stdout_fd, 65536):
+        console.write(chunk)
+        console.flush()
+        log_file.write(chunk)
 
 
-def _try_extract_reports_archive(
-    container_name: str, tempdir_path: Path
-) -> Path | None:
-    """Try to copy the reports archive from the container.
+def _try_stream_reports_archive(
+    container_name: str, archive_path_in_container: PurePosixPath, staging_dir: Path
+) -> bool:
+    """Try to stream the reports archive from the container and extract it.
+
+    The archive is read from the ``docker exec`` pipe as it arrives, so no copy
+    of it is written to disk.  Extraction uses the ``data`` filter, which
+    rejects absolute paths, path traversal and special files.
 
     :param str container_name: Name of the running dind container.
-    :param Path tempdir_path: Scratch directory for the extracted archive.
-    :return: Path to the local copy, or ``None`` if unavailable.
-    :rtype: Path | None
+    :param archive_path_in_container: Path of the reports archive to extract.
+    :type archive_path_in_container: PurePosixPath
+    :param Path staging_dir: Host directory to extract ``reports`` into.
+    :return: ``True`` if the archive was extracted.
+    :rtype: bool
     """
-    archive_path_in_container = _get_latest_reports_archive_path(container_name)
-    if archive_path_in_container is None:
-        return None
-    local_path = tempdir_path / archive_path_in_container.name
-    result = subprocess.run(
-        [
-            "docker",
-            "cp",
-            f"{container_name}:{archive_path_in_container}",
-            str(local_path),
-        ],
-        check=False,
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        print(f"Could not copy reports archive: {result.stderr.strip()}", flush=True)
-        return None
-    return local_path
+    error: Exception | None = None
+    with subprocess.Popen(
+        ["docker", "exec", container_name, "cat", str(archive_path_in_container)],
+        stdout=subprocess.PIPE,
+    ) as producer:
+        if producer.stdout is None:
+            raise RuntimeError("Expected process stdout to be available.")
+        try:
+            with tarfile.open(fileobj=producer.stdout, mode="r|gz") as archive:
+                # The filter is missing from Python 3.9-3.11 releases that
+                # predate its backport; a stream cannot be rewound to retry.
+                if hasattr(tarfile, "data_filter"):
+                    archive.extractall(path=staging_dir, filter="data")
+                else:
+                    archive.extractall(path=staging_dir)
+        except (tarfile.TarError, OSError) as exc:
+            error = exc
+            producer.kill()
+    if error is not None or producer.returncode != 0:
+        print(
+            f"Could not extract reports archive {archive_path_in_container}"
+            f" (docker exec exited {producer.returncode}"
+            f"{'' if error is None else f', {error}'}).",
+            flush=True,
+        )
+        shutil.rmtree(staging_dir / "reports", ignore_errors=True)
+        return False
+    return True
 
 
 @dataclass(frozen=True)
@@ -774,7 +950,8 @@ class ParsedInnerArchiveName:
 def _assemble_final_reports_bundle(
     *,
     repo_root: Path,
-    inner_archive_path: Path | None,
+    staging_dir: Path,
+    parsed_archive_name: ParsedInnerArchiveName | None,
     ci_log_path: Path,
     run_timestamp: datetime,
     ci_passed: bool,
@@ -782,8 +959,10 @@ def _assemble_final_reports_bundle(
     """Assemble final reports bundle under the repository `.ci-reports` directory.
 
     :param Path repo_root: Repository root on the host.
-    :param inner_archive_path: Path to the inner reports archive, or ``None``.
-    :type inner_archive_path: Path | None
+    :param Path staging_dir: Directory holding the extracted ``reports``, if any.
+    :param parsed_archive_name: Fields parsed from the inner archive name, or
+        ``None``.
+    :type parsed_archive_name: ParsedInnerArchiveName | None
     :param Path ci_log_path: Path to the CI log file on the host.
     :param run_timestamp: UTC timestamp captured right before the CI run.
     :type run_timestamp: datetime
@@ -795,9 +974,10 @@ def _assemble_final_reports_bundle(
     reports_dir = repo_root / ".ci-reports"
     reports_dir.mkdir(parents=True, exist_ok=True)
 
-    parsed = _try_parse_inner_archive_name(inner_archive_path)
-    if parsed is not None:
-        suffix = f"{parsed.tree_date}_{ts}_{parsed.tree_hash}"
+    if parsed_archive_name is not None:
+        tree_date = parsed_archive_name.tree_date
+        tree_hash = parsed_archive_name.tree_hash
+        suffix = f"{tree_date}_{ts}_{tree_hash}"
     else:
         suffix = ts
 
@@ -806,45 +986,72 @@ def _assemble_final_reports_bundle(
     ci_log_name = f"ci_test_{suffix}.out"
     final_archive_path = reports_dir / final_archive_name
 
-    with tempfile.TemporaryDirectory() as tempdir:
-        tempdir_path = Path(tempdir)
-        staging_dir = tempdir_path / "staging"
-        staging_dir.mkdir(parents=True, exist_ok=True)
+    bundled_ci_log = staging_dir / ci_log_name
+    shutil.copyfile(ci_log_path, bundled_ci_log)
+    members = [ci_log_name]
+    if (staging_dir / "reports").is_dir():
+        members.insert(0, "reports")
+    _write_tar_gz(final_archive_path, staging_dir, members)
+    return final_archive_path
 
-        if inner_archive_path is not None:
-            with tarfile.open(inner_archive_path, "r:gz") as archive:
-                try:
-                    archive.extractall(path=staging_dir, filter="data")
-                except TypeError:
-                    archive.extractall(path=staging_dir)
 
-        bundled_ci_log = staging_dir / ci_log_name
-        bundled_ci_log.write_text(
-            ci_log_path.read_text(encoding="utf-8"), encoding="utf-8"
-        )
-        with tarfile.open(final_archive_path, "w:gz") as out_archive:
-            if (staging_dir / "reports").is_dir():
-                out_archive.add(staging_dir / "reports", arcname="reports")
-            out_archive.add(bundled_ci_log, arcname=ci_log_name)
-    return final_archive_path
+def _write_tar_gz(archive_path: Path, source_dir: Path, members: list[str]) -> None:
+    """Write ``members`` of ``source_dir`` to a gzip-compressed tar archive.
+
+    The host ``tar`` is used when there is one, as it is faster than
+    ``tarfile``; hosts without it fall back to ``tarfile``.
+    """
+    tar = shutil.which("tar")
+    if tar is None:
+        with tarfile.open(archive_path, "w:gz") as out_archive:
+            for member in members:
+                out_archive.add(source_dir / member, arcname=member)
+        return
+    _run_checked(
+        [
+            tar,
+            *_tar_compression_args(),
+            "-cf",
+            str(archive_path),
+            "-C",
+            str(source_dir),
+            *members,
+        ]
+    )
+
+
+def _tar_compression_args() -> list[str]:
+    """Return ``tar`` gzip options, using multi-core ``pigz`` when available."""
+    if shutil.which("pigz") is not None:
+        return ["--use-compress-program=pigz"]
+    return ["-z"]
 
 
 @dataclass(frozen=True)
 class ImageGraph:
     """Container for active image graph metadata."""
 
-    name_to_dir: dict[str, Path]
-    dependencies: dict[str, set[str]]
-    reverse_deps: dict[str, set[str]]
+    name_to_dir: Mapping[str, Path]
+    dependencies: Mapping[str, frozenset[str]]
+    reverse_deps: Mapping[str, frozenset[str]]
 
 
+@cache
 def _collect_active_image_graph(docker_images_root: Path) -> ImageGraph:
-    """Collect active image nodes and dependency edges."""
+    """Collect active image nodes and dependency edges.
+
+    The result is cached and shared, so its mappings are read-only.
+    """
     name_to_dir: dict[str, Path] = {}
     dependencies: dict[str, set[str]] = defaultdict(set)
     reverse_deps: dict[str, set[str]] = defaultdict(set)
 
-    for image_info_file in sorted(docker_images_root.glob("*/image_info.json")):
+    with os.scandir(docker_images_root) as entries:
+        image_dir_names = sorted(entry.name for entry in entries if entry.is_dir())
+    for image_dir_name in image_dir_names:
+        image_info_file = docker_images_root / image_dir_name / "image_info.json"
+        if not image_info_file.is_file():
+            continue
         info = _load_image_info(image_info_file)
         image_name = _extract_active_image_name(info)
         if image_name is None:
@@ -854,82 +1061,117 @@ def _collect_active_image_graph(docker_images_root: Path) -> ImageGraph:
             dependencies[image_name].add(dependency)
             reverse_deps[dependency].add(image_name)
     return ImageGraph(
-        name_to_dir=name_to_dir,
-        dependencies=dependencies,
-        reverse_deps=reverse_deps,
+        name_to_dir=MappingProxyType(name_to_dir),
+        dependencies=MappingProxyType(
+            {name: frozenset(deps) for name, deps in dependencies.items()}
+        ),
+        reverse_deps=MappingProxyType(
+            {name: frozenset(deps) for name, deps in reverse_deps.items()}
+        ),
     )
 
 
-def _topological_sort_image_names(
-    name_to_dir: dict[str, Path],
-    dependencies: dict[str, set[str]],
-    reverse_deps: dict[str, set[str]],
-) -> list[str]:
-    """Topologically sort image names by dependency graph."""
-    indegree = {name: len(dependencies.get(name, set())) for name in name_to_dir}
-    queue = deque(sorted(name for name, degree in indegree.items() if degree == 0))
-    sorted_names: list[str] = []
-    while queue:
-        node = queue.popleft()
-        sorted_names.append(node)
-        for child in sorted(reverse_deps.get(node, set())):
-            indegree[child] -= 1
-            if indegree[child] == 0:
-                queue.append(child)
-    if len(sorted_names) != len(name_to_dir):
+def _topological_layers(graph: ImageGraph) -> list[list[str]]:
+    """Group image names into layers that only depend on earlier layers.
+
+    Each layer is sorted by name; concatenating the layers gives a
+    topological order of all images.
+
+    :raises RuntimeError: If the dependencies contain a cycle or name an
+        image that is not active.
+    """
+    indegree = {
+        name: len(graph.dependencies.get(name, frozenset()))
+        for name in graph.name_to_dir
+    }
+    layer = sorted(name for name, degree in indegree.items() if degree == 0)
+    layers: list[list[str]] = []
+    while layer:
+        layers.append(layer)
+        next_layer: list[str] = []
+        for node in layer:
+            for child in graph.reverse_deps.get(node, frozenset()):
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    next_layer.append(child)
+        layer = sorted(next_layer)
+    if sum(map(len, layers)) != len(graph.name_to_dir):
         raise RuntimeError("Could not topologically sort docker images.")
-    return sorted_names
+    return layers
 
 
 def _get_latest_reports_archive_path(
     container_name: str,
 ) -> PurePosixPath | None:
-    """Locate the newest reports archive path inside the container."""
-    list_cmd = (
-        "ls -1t "
-        + shlex.quote(str(CONTAINER_REPO_CLONE_DIR))
-        + "/reports_*.tar.gz 2>/dev/null | head -n1"
-    )
+    """Locate the newest reports archive path inside the container.
+
+    The dind image is Alpine based, whose busybox ``find`` has no ``-printf``,
+    so modification times are reported through ``stat`` instead.
+    """
     result = subprocess.run(
-        ["docker", "exec", container_name, "sh", "-c", list_cmd],
+        [
+            "docker",
+            "exec",
+            container_name,
+            "find",
+            str(CONTAINER_REPO_CLONE_DIR),
+            "-maxdepth",
+            "1",
+            "-name",
+            "reports_*.tar.gz",
+            "-exec",
+            "stat",
+            "-c",
+            "%Y %n",
+            "{}",
+            ";",
+        ],
         check=False,
         capture_output=True,
         text=True,
     )
-    archive_path = result.stdout.strip()
-    if result.returncode != 0 or not archive_path:
+    candidates: list[tuple[int, str]] = []
+    if result.returncode == 0:
+        for line in result.stdout.splitlines():
+            mtime, _, archive_path = line.partition(" ")
+            if mtime.isdigit() and archive_path:
+                candidates.append((int(mtime), archive_path))
+    if not candidates:
         print(f"No reports archive found in {CONTAINER_REPO_CLONE_DIR}.", flush=True)
         return None
-    return PurePosixPath(archive_path)
+    return PurePosixPath(max(candidates)[1])
 
 
 def _format_timestamp(ts: datetime) -> str:
     """Format a UTC datetime as ``YYYYMMDD_HH_MM_SS_fff``."""
-    ms = ts.microsecond // 1000
-    return ts.strftime("%Y%m%d_%H_%M_%S") + f"_{ms:03d}"
+    return (
+        f"{ts.year:04d}{ts.month:02d}{ts.day:02d}"
+        f"_{ts.hour:02d}_{ts.minute:02d}_{ts.second:02d}_{ts.microsecond // 1000:03d}"
+    )
 
 
 def _try_parse_inner_archive_name(
-    inner_archive_path: Path | None,
+    inner_archive_path: PurePath | None,
 ) -> ParsedInnerArchiveName | None:
     """Parse reports archive date/hash fields from the filename.
 
     :param inner_archive_path: Path to the inner archive, or ``None``.
-    :type inner_archive_path: Path | None
+    :type inner_archive_path: PurePath | None
     :return: Parsed fields, or ``None`` if parsing fails or path is ``None``.
     :rtype: ParsedInnerArchiveName | None
     """
     if inner_archive_path is None:
         return None
     archive_name = inner_archive_path.name
-    if not archive_name.startswith("reports_") or not archive_name.endswith(".tar.gz"):
+    without_prefix = archive_name.removeprefix("reports_")
+    if without_prefix == archive_name:
         return None
-    suffix = archive_name[len("reports_") : -len(".tar.gz")]
-    first_separator = suffix.find("_")
-    if first_separator <= 0:
+    suffix = without_prefix.removesuffix(".tar.gz")
+    if suffix == without_prefix:
+        return None
+    tree_date, separator, tree_hash = suffix.partition("_")
+    if not separator or not tree_date:
         return None
-    tree_date = suffix[:first_separator]
-    tree_hash = suffix[first_separator + 1 :]
     return ParsedInnerArchiveName(tree_date=tree_date, tree_hash=tree_hash)
 
 
@@ -948,11 +1190,9 @@ def _extract_dependencies(info: dict[str, object]) -> list[str]:
     raw_dependencies = info.get("depends_on", [])
     if not isinstance(raw_dependencies, list):
         return []
-    deps: list[str] = []
-    for dependency in raw_dependencies:
-        if isinstance(dependency, str):
-            deps.append(dependency)
-    return deps
+    return [
+        dependency for dependency in raw_dependencies if isinstance(dependency, str)
+    ]
 
 
 if __name__ == "__main__":
@@ -6,35 +6,90 @@ that key public APIs are accessible.  They use only the standard library
 has nothing besides the package under test.
 """
 
+from functools import cache
 import unittest
 
 
+# Imported once at module scope.  A broken installation must still produce
+# per-test failures rather than an import error for the whole module, so each
+# subpackage is guarded on its own: its names fall back to ``None`` and its
+# ``ImportError`` is kept for the tests that need it to report.
+_IMPORT_ERRORS = {}
+
+try:
+    import am_common_lib
+except ImportError as e:
+    am_common_lib = None
+    _IMPORT_ERRORS["am_common_lib"] = e
+
+try:
+    from am_common_lib import resource_utils
+except ImportError as e:
+    resource_utils = None
+    _IMPORT_ERRORS["am_common_lib.resource_utils"] = e
+
+try:
+    from am_common_lib.common import ImmutableDict
+    from am_common_lib.common import ImmutableJSONDict
+    from am_common_lib.common import ImmutableJSONList
+    from am_common_lib.common import ImmutableJSONValue
+    from am_common_lib.common import ImmutableList
+    from am_common_lib.common import JSONDict
+    from am_common_lib.common import JSONList
+    from am_common_lib.common import JSONPrimitive
+    from am_common_lib.common import JSONValue
+    from am_common_lib.common import parse_json_immutable
+except ImportError as e:
+    ImmutableDict = ImmutableList = parse_json_immutable = None
+    JSONPrimitive = JSONValue = JSONDict = JSONList = None
+    ImmutableJSONValue = ImmutableJSONDict = ImmutableJSONList = None
+    _IMPORT_ERRORS["am_common_lib.common"] = e
+
+try:
+    from am_common_lib.docker_util import ImageNames
+except ImportError as e:
+    ImageNames = None
+    _IMPORT_ERRORS["am_common_lib.docker_util"] = e
+
+try:
+    from am_common_lib.docker_util.docker_runner import DockerRunner
+except ImportError as e:
+    DockerRunner = None
+    _IMPORT_ERRORS["am_common_lib.docker_util.docker_runner"] = e
+
+
+def _assert_imported(test, module_name):
+    """Fail `test` with the ``ImportError`` of `module_name`, if its import failed."""
+    error = _IMPORT_ERRORS.get(module_name)
+    if error is not None:
+        raise test.failureException(
+            f"Could not import {module_name}: {error}"
+        ) from error
+
+
+@cache
+def _pkg_version():
+    """Return the installed ``am-common-lib`` version, resolved only once."""
+    from importlib.metadata import version
+
+    return version("am-common-lib")
+
+
 class TestPackageImports(unittest.TestCase):
     """Verify that all public subpackages import without errors."""
 
     def test_import_root_package(self):
-        import am_common_lib
-
+        _assert_imported(self, "am_common_lib")
         self.assertTrue(hasattr(am_common_lib, "__name__"))
 
     def test_import_common_subpackage(self):
-        from am_common_lib.common import ImmutableDict
-        from am_common_lib.common import ImmutableList
-        from am_common_lib.common import parse_json_immutable
-
+        _assert_imported(self, "am_common_lib.common")
         self.assertIsNotNone(ImmutableDict)
         self.assertIsNotNone(ImmutableList)
         self.assertIsNotNone(parse_json_immutable)
 
     def test_import_json_type_aliases(self):
-        from am_common_lib.common import ImmutableJSONDict
-        from am_common_lib.common import ImmutableJSONList
-        from am_common_lib.common import ImmutableJSONValue
-        from am_common_lib.common import JSONDict
-        from am_common_lib.common import JSONList
-        from am_common_lib.common import JSONPrimitive
-        from am_common_lib.common import JSONValue
-
+        _assert_imported(self, "am_common_lib.common")
         for alias in (
             JSONPrimitive,
             JSONValue,
@@ -47,18 +102,15 @@ class TestPackageImports(unittest.TestCase):
             self.assertIsNotNone(alias)
 
     def test_import_docker_util(self):
-        from am_common_lib.docker_util import ImageNames
-
+        _assert_imported(self, "am_common_lib.docker_util")
         self.assertIsNotNone(ImageNames)
 
     def test_import_docker_runner(self):
-        from am_common_lib.docker_util.docker_runner import DockerRunner
-
+        _assert_imported(self, "am_common_lib.docker_util.docker_runner")
         self.assertTrue(callable(DockerRunner))
 
     def test_import_resource_utils(self):
-        from am_common_lib import resource_utils
-
+        _assert_imported(self, "am_common_lib.resource_utils")
         for fn_name in (
             "read_resource_text",
             "read_resource_bytes",
@@ -74,45 +126,34 @@ class TestPackageImports(unittest.TestCase):
 class TestBasicFunctionality(unittest.TestCase):
     """Verify basic functionality of core types after installation."""
 
-    def test_immutable_dict_creation_and_lookup(self):
-        from am_common_lib.common import ImmutableDict
+    def setUp(self):
+        _assert_imported(self, "am_common_lib.common")
 
+    def test_immutable_dict_creation_and_lookup(self):
         d = ImmutableDict({"a": 1, "b": 2})
         self.assertEqual(d["a"], 1)
         self.assertEqual(len(d), 2)
 
     def test_immutable_dict_blocks_mutation(self):
-        from am_common_lib.common import ImmutableDict
-
         d = ImmutableDict({"x": 10})
         with self.assertRaises(TypeError):
             d["y"] = 20  # type: ignore[index]
 
     def test_immutable_dict_is_hashable(self):
-        from am_common_lib.common import ImmutableDict
-
         d = ImmutableDict({"a": 1})
         self.assertIsInstance(hash(d), int)
 
     def test_immutable_list_creation_and_lookup(self):
-        from am_common_lib.common import ImmutableList
-
         lst = ImmutableList([10, 20, 30])
         self.assertEqual(lst[0], 10)
         self.assertEqual(len(lst), 3)
 
     def test_immutable_list_blocks_mutation(self):
-        from am_common_lib.common import ImmutableList
-
         lst = ImmutableList([1, 2, 3])
         with self.assertRaises(TypeError):
             lst[0] = 99  # type: ignore[index]
 
     def test_parse_json_immutable_roundtrip(self):
-        from am_common_lib.common import ImmutableDict
-        from am_common_lib.common import ImmutableList
-        from am_common_lib.common import parse_json_immutable
-
         result = parse_json_immutable('{"key": [1, 2, 3], "nested": {"a": true}}')
         self.assertIsInstance(result, ImmutableDict)
         self.assertIsInstance(result["key"], ImmutableList)
@@ -125,15 +166,11 @@ class TestPackageMetadata(unittest.TestCase):
     """Verify package metadata is accessible."""
 
     def test_version_is_present(self):
-        from importlib.metadata import version
-
-        v = version("am-common-lib")
+        v = _pkg_version()
         self.assertTrue(len(v) > 0, "version string should not be empty")
 
     def test_version_starts_with_expected_prefix(self):
-        from importlib.metadata import version
-
-        v = version("am-common-lib")
+        v = _pkg_version()
         self.assertTrue(
             v.startswith("0."),
             f"Expected version to start with '0.', got '{v}'",
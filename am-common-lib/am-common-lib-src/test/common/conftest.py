@@ -0,0 +1,40 @@
+"""Shared fixtures for the immutable container tests.
+
+The immutable containers are built once per session and shared by every module in
+this directory. The plain dict and list they are compared against are mutable, so
+each test gets fresh copies of those.
+"""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Any
+
+import pytest
+
+from am_common_lib.common import ImmutableDict
+from am_common_lib.common import ImmutableList
+
+
+_SAMPLE_MAPPING = MappingProxyType({"a": 1, "b": 2})
+_SAMPLE_ITEMS = ("Item", 1, True)
+
+
+@pytest.fixture(scope="function")
+def sample_mapping() -> dict[str, int]:
+    return dict(_SAMPLE_MAPPING)
+
+
+@pytest.fixture(scope="session")
+def imm_dict() -> ImmutableDict[str, int]:
+    return ImmutableDict(dict(_SAMPLE_MAPPING))
+
+
+@pytest.fixture(scope="function")
+def sample_list() -> list[Any]:
+    return list(_SAMPLE_ITEMS)
+
+
+@pytest.fixture(scope="session")
+def imm_list() -> ImmutableList[Any]:
+    return ImmutableList(list(_SAMPLE_ITEMS))
@@ -1,3 +1,4 @@
+from functools import cache
 import json
 from typing import Any
 
@@ -10,16 +11,31 @@ from am_common_lib.common import ImmutableList
 from am_common_lib.common import parse_json_immutable
 
 
+_PRIMITIVE_TYPES = (str, int, float, bool, type(None))
+
+
+@cache
+def _expected(json_str: str) -> Any:
+    # Reference result only; parse_json_immutable itself is never cached.
+    return json.loads(json_str)
+
+
 def _is_deeply_immutable(obj: Any) -> bool:
-    if isinstance(obj, (str, int, float, bool, type(None))):
-        return True
-    if isinstance(obj, ImmutableDict):
-        return all(_is_deeply_immutable(v) for v in obj.values()) and all(
-            isinstance(k, str) for k in obj
-        )
-    if isinstance(obj, ImmutableList):
-        return all(_is_deeply_immutable(v) for v in obj)
-    return False
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, _PRIMITIVE_TYPES):
+            continue
+        if isinstance(current, ImmutableDict):
+            for key, value in current.items():
+                if not isinstance(key, str):
+                    return False
+                stack.append(value)
+        elif isinstance(current, ImmutableList):
+            stack.extend(current)
+        else:
+            return False
+    return True
 
 
 @pytest.mark.parametrize(
@@ -94,7 +110,7 @@ def test_parse_json_immutable_various_cases(json_str: str, case_name: str) -> No
     2. The result is deeply immutable
     """
     # Parse with standard JSON
-    expected = json.loads(json_str)
+    expected = _expected(json_str)
 
     # Parse with immutable version
     result = parse_json_immutable(json_str)
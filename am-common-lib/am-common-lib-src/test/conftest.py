@@ -20,7 +20,16 @@ _VDENV_OPTION_DEFAULTS: Final[dict[str, str]] = {
 
 
 def pytest_addoption(parser: pytest.Parser) -> None:
-    """Register ``--dind-uv``, ``--dind-sshd``, ``--vdenv-ssh`` CLI options."""
+    """Register ``--skip-missing-images``, ``--dind-uv``, ``--dind-sshd``,
+    ``--vdenv-ssh`` CLI options."""
+    docker_group = parser.getgroup("docker", "docker image tests")
+    docker_group.addoption(
+        "--skip-missing-images",
+        action="store_true",
+        default=False,
+        help="Skip the docker_util tests whose image is not present locally, "
+        "instead of pulling it",
+    )
     group = parser.getgroup("vdenv", "vdenv image integration tests")
     group.addoption(
         "--dind-uv",
@@ -0,0 +1,169 @@
+"""Pytest hooks shared by the docker_util tests.
+
+Tests parametrized on an ``image`` are grouped per image for ``--dist loadgroup``,
+so that every test of one image runs on the same xdist worker. That worker pulls
+the image once and keeps its layers warm, while different images run in parallel.
+
+Tests that start containers can request :func:`pulled_registry_images`, which
+concurrently pulls the public registry images that the selected tests are
+parametrized on and that are not present locally yet. Other fixtures can pull the
+images they need through :func:`pull_missing_images`. Set ``DOCKER_MIRROR`` to pull
+official Docker Hub images through a registry mirror (e.g. ``mirror.example.com``);
+they are re-tagged with their usual names.
+
+With ``--skip-missing-images`` nothing is pulled; instead, tests whose image is
+not present locally are skipped at collection time.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+import os
+from pathlib import Path
+import shutil
+import subprocess
+
+import pytest
+
+from am_common_lib.docker_util import ImageNames
+
+
+_HERE = Path(__file__).parent
+
+_REGISTRY_IMAGES = (
+    ImageNames.ALPINE_LATEST,
+    ImageNames.BUSYBOX_LATEST,
+    ImageNames.UBUNTU_LATEST,
+    "mysql:5.7",
+    "mysql:8.0",
+)
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Add an ``xdist_group`` per ``image`` to the tests below this directory, and
+    with ``--skip-missing-images`` skip those whose image is not present locally."""
+    local_images = (
+        _local_images() if config.getoption("--skip-missing-images") else None
+    )
+    for item in items:
+        if not item.path.is_relative_to(_HERE):
+            continue
+        callspec = getattr(item, "callspec", None)
+        image = callspec.params.get("image") if callspec is not None else None
+        if isinstance(image, str) and item.get_closest_marker("xdist_group") is None:
+            item.add_marker(pytest.mark.xdist_group(name=f"docker-image-{image}"))
+        if local_images is None:
+            continue
+        target = _started_image(item)
+        if target is not None and _with_tag(target) not in local_images:
+            item.add_marker(pytest.mark.skip(reason=f"image {target} not present"))
+
+
+def _started_image(item: pytest.Item) -> str | None:
+    """Return the image `item` is parametrized to start, if any."""
+    callspec = getattr(item, "callspec", None)
+    params = callspec.params if callspec is not None else {}
+    version = params.get("version")
+    # test_mysql_different_versions is parametrized on the MySQL version
+    image = f"mysql:{version}" if isinstance(version, str) else params.get("image")
+    return image if isinstance(image, str) else None
+
+
+def _local_images() -> frozenset[str]:
+    """Return the ``repository:tag`` of every image present locally."""
+    if shutil.which("docker") is None:
+        return frozenset()
+    res = subprocess.run(
+        ["docker", "image", "ls", "--format", "{{.Repository}}:{{.Tag}}"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return frozenset(res.stdout.split()) if res.returncode == 0 else frozenset()
+
+
+def _with_tag(image: str) -> str:
+    """Return `image` with the implicit ``:latest`` tag spelled out."""
+    return image if ":" in image.rpartition("/")[2] else f"{image}:latest"
+
+
+@pytest.fixture(scope="session")
+def pull_missing_images() -> Callable[[Iterable[str]], None]:
+    """Return :func:`_pull_missing`, for fixtures that need images pulled."""
+    return _pull_missing
+
+
+@pytest.fixture(scope="session")
+def pulled_registry_images(request: pytest.FixtureRequest) -> None:
+    """Pull the missing :data:`_REGISTRY_IMAGES` that the selected tests start.
+
+    Images that no selected test is parametrized on are left to ``docker run``,
+    which pulls on demand. Without a docker CLI nothing is pulled; the tests
+    report that themselves.
+    """
+    if (
+        request.config.getoption("--skip-missing-images")
+        or shutil.which("docker") is None
+    ):
+        return
+    wanted = {_started_image(item) for item in request.session.items}
+    _pull_missing(image for image in _REGISTRY_IMAGES if image in wanted)
+
+
+def _pull_missing(images: Iterable[str]) -> None:
+    """Concurrently pull those of `images` that are not present locally.
+
+    Images already present are not refreshed, so tests do not silently move to
+    newer upstream images. If any pull fails, the calling fixture fails with the
+    error of every image that could not be pulled.
+    """
+    missing = [image for image in images if not _is_present(image)]
+    if not missing:
+        return
+    with ThreadPoolExecutor(max_workers=min(8, len(missing))) as pool:
+        errors = [error for error in pool.map(_pull, missing) if error]
+    if errors:
+        pytest.fail("\n".join(errors))
+
+
+def _is_present(image: str) -> bool:
+    return (
+        subprocess.run(
+            ["docker", "image", "inspect", image],
+            check=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        ).returncode
+        == 0
+    )
+
+
+def _pull(image: str) -> str:
+    """Pull `image`, returning an error message if that failed, or ``""``.
+
+    Official Docker Hub images are pulled through ``DOCKER_MIRROR`` if it is set.
+    """
+    mirror = os.environ.get("DOCKER_MIRROR")
+    if not mirror or "/" in image:
+        source = image
+    else:
+        source = f"{mirror.rstrip('/')}/library/{image}"
+    res = subprocess.run(
+        ["docker", "pull", source], check=False, capture_output=True, text=True
+    )
+    if res.returncode != 0:
+        return f"Failed to pull image {source}: {res.stderr.strip()}"
+    if source != image:
+        res = subprocess.run(
+            ["docker", "tag", source, image],
+            check=False,
+            capture_output=True,
+            text=True,
+        )
+        if res.returncode != 0:
+            return f"Failed to tag {source} as {image}: {res.stderr.strip()}"
+    return ""
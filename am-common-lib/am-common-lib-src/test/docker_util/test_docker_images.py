@@ -1,15 +1,20 @@
-from collections import defaultdict
 from collections import deque
+from collections.abc import Callable
 from collections.abc import Generator
-from contextlib import AbstractContextManager
-from contextlib import nullcontext
+from collections.abc import Iterable
+from contextlib import ExitStack
+from dataclasses import dataclass
 from functools import cache
 import importlib.resources
 from importlib.resources.abc import Traversable
 import json
+import os
 from pathlib import Path
+import re
 import shlex
 import subprocess
+import threading
+from typing import Any
 
 from assertpy import assert_that
 from assertpy import soft_assertions
@@ -19,81 +24,172 @@ from am_common_lib.docker_util import ImageNames
 from am_common_lib.docker_util.docker_runner import DockerRunner
 
 
+_FROM_RE = re.compile(
+    r"^FROM\s+(?:--\S+\s+)*(\S+)(?:[ \t]+AS[ \t]+(\S+))?",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
 pytestmark = pytest.mark.xdist_group("docker")
 
 
 @cache
-def image_dirs() -> list[Traversable]:
-    return _topologically_sort_images(
-        [path for path in docker_images_root().iterdir() if path.is_dir()]
-    )
+def image_dirs() -> tuple[Traversable, ...]:
+    """Return the image dirs in topological order, dependencies first."""
+    return tuple(_dfs_toposort(*_image_dependency_graph()))
 
 
-def _build_dependency_graph(
-    unsorted_image_dirs: list[Traversable],
-) -> tuple[dict[str, Traversable], dict[str, set[str]], dict[str, set[str]]]:
-    """Build graph structures from image metadata."""
-    name_to_dir: dict[str, Traversable] = {}
-    dependencies: dict[str, set[str]] = defaultdict(set)
-    reverse_deps: dict[str, set[str]] = defaultdict(set)
+class _ExtractedDirs:
+    """Image dirs materialized as real paths, kept until the session ends.
 
-    for d in unsorted_image_dirs:
-        info_file = d.joinpath("image_info.json")
-        if not info_file.is_file():
-            continue
-        with info_file.open("r", encoding="utf-8") as f:
-            info = json.load(f)
+    :func:`importlib.resources.as_file` may copy a resource tree to a temporary
+    directory; this does it at most once per image dir and session.
+    """
+
+    def __init__(self, stack: ExitStack) -> None:
+        self._stack = stack
+        self._paths: dict[str, Path] = {}
+
+    def __getitem__(self, dir_name: str) -> Path:
+        if dir_name not in self._paths:
+            self._paths[dir_name] = self._stack.enter_context(
+                importlib.resources.as_file(docker_images_root().joinpath(dir_name))
+            )
+        return self._paths[dir_name]
+
+
+@pytest.fixture(scope="session")
+def extracted_dirs() -> Generator[_ExtractedDirs]:
+    with ExitStack() as stack:
+        yield _ExtractedDirs(stack)
 
-        img_name = info.get("image_name")
-        if not img_name:
+
+@pytest.fixture(scope="session")
+def pulled_base_images(pull_missing_images: Callable[[Iterable[str]], None]) -> None:
+    """Pull the external base images of all active images that are not present
+    locally.
+
+    The builds then find every base layer in the local cache instead of each
+    pulling on its own.
+    """
+    pull_missing_images(_external_base_images())
+
+
+def _external_base_images() -> list[str]:
+    """Return the ``FROM`` images of active images that are not built here."""
+    name_to_dir, _ = _image_dependency_graph()
+    bases: set[str] = set()
+    for image_dir in name_to_dir.values():
+        if not _load_image_info(image_dir).get("active", False):
             continue
+        if "Dockerfile" in _image_dir_files(image_dir.name):
+            dockerfile = image_dir.joinpath("Dockerfile").read_text(encoding="utf-8")
+            bases.update(_from_images(dockerfile))
+    return sorted(bases - set(name_to_dir) - {"scratch"})
 
-        name_to_dir[img_name] = d
-        for dep in info.get("depends_on", []):
-            dependencies[img_name].add(dep)
-            reverse_deps[dep].add(img_name)
 
-    return name_to_dir, dependencies, reverse_deps
+def _from_images(dockerfile: str) -> set[str]:
+    """Return the images `dockerfile` builds from, leaving out references to its
+    own earlier build stages (``FROM builder`` after ``FROM ... AS builder``)."""
+    images: set[str] = set()
+    stages: set[str] = set()
+    for image, stage in _FROM_RE.findall(dockerfile):
+        if image.lower() not in stages:
+            images.add(image)
+        if stage:
+            stages.add(stage.lower())
+    return images
 
 
-def _kahn_sort(
-    name_to_dir: dict[str, Traversable],
-    dependencies: dict[str, set[str]],
-    reverse_deps: dict[str, set[str]],
-) -> list[Traversable]:
-    """Return nodes in topological order using Kahn's algorithm."""
-    indegree: dict[str, int] = {name: len(deps) for name, deps in dependencies.items()}
-    for name in name_to_dir:
-        indegree.setdefault(name, 0)
+@cache
+def _image_dependency_graph() -> tuple[
+    dict[str, Traversable], dict[str, frozenset[str]]
+]:
+    return _build_dependency_graph(
+        [path for path in docker_images_root().iterdir() if path.is_dir()]
+    )
 
-    queue = deque([name for name, deg in indegree.items() if deg == 0])
-    sorted_names: list[str] = []
 
-    while queue:
-        node = queue.popleft()
-        sorted_names.append(node)
-        for child in reverse_deps.get(node, []):
-            indegree[child] -= 1
-            if indegree[child] == 0:
-                queue.append(child)
+@cache
+def _image_dir_files(dir_name: str) -> frozenset[str]:
+    """Return the entry names of an image dir, listed once per session."""
+    return frozenset(
+        child.name for child in docker_images_root().joinpath(dir_name).iterdir()
+    )
 
-    if len(sorted_names) < len(name_to_dir):
-        missing = set(name_to_dir) - set(sorted_names)
-        raise RuntimeError(
-            f"Circular or missing dependencies detected among: {missing}"
-        )
 
-    return [name_to_dir[name] for name in sorted_names]
+def _load_image_info(image_dir: Traversable) -> dict[str, Any]:
+    # Traversable is not Hashable, so the cache is keyed by the dir name.
+    return _load_image_info_by_name(image_dir.name)
+
+
+@cache
+def _load_image_info_by_name(dir_name: str) -> dict[str, Any]:
+    info_file = docker_images_root().joinpath(dir_name, "image_info.json")
+    info: dict[str, Any] = json.loads(info_file.read_bytes())
+    return info
 
 
-def _topologically_sort_images(
+@dataclass(frozen=True)
+class _ImageMeta:
+    """The graph-relevant part of one image's ``image_info.json``."""
+
+    dir: Traversable
+    name: str
+    deps: frozenset[str]
+
+
+def _build_dependency_graph(
     unsorted_image_dirs: list[Traversable],
+) -> tuple[dict[str, Traversable], dict[str, frozenset[str]]]:
+    """Build graph structures from image metadata."""
+    metas = [
+        _ImageMeta(d, info["image_name"], frozenset(info.get("depends_on", ())))
+        for d in unsorted_image_dirs
+        if "image_info.json" in _image_dir_files(d.name)
+        and (info := _load_image_info(d)).get("image_name")
+    ]
+    name_to_dir = {meta.name: meta.dir for meta in metas}
+    dependencies = {meta.name: meta.deps for meta in metas if meta.deps}
+    return name_to_dir, dependencies
+
+
+def _dfs_toposort(
+    name_to_dir: dict[str, Traversable],
+    dependencies: dict[str, frozenset[str]],
 ) -> list[Traversable]:
-    """Return image_dirs sorted topologically based on 'depends_on' metadata."""
-    name_to_dir, dependencies, reverse_deps = _build_dependency_graph(
-        unsorted_image_dirs
-    )
-    return _kahn_sort(name_to_dir, dependencies, reverse_deps)
+    """Return nodes in topological order using an iterative DFS.
+
+    Nodes are emitted in post-order, after all their dependencies.
+    """
+    done: set[str] = set()
+    visiting: set[str] = set()
+    order: list[str] = []
+
+    for start in name_to_dir:
+        if start in done:
+            continue
+        # Each entry is (name, expanded): dependencies are pushed on the first
+        # visit, and the node is emitted on the second.
+        stack = [(start, False)]
+        while stack:
+            name, expanded = stack.pop()
+            if expanded:
+                visiting.discard(name)
+                done.add(name)
+                order.append(name)
+                continue
+            if name in done:
+                continue
+            if name in visiting or name not in name_to_dir:
+                raise RuntimeError(
+                    f"Circular or missing dependencies detected among: {name!r}"
+                )
+            visiting.add(name)
+            stack.append((name, True))
+            stack.extend((dep, False) for dep in dependencies.get(name, ()))
+
+    return [name_to_dir[name] for name in order]
 
 
 @cache
@@ -107,27 +203,38 @@ def test_images_dir_exists() -> None:
     )
 
 
+def test_from_images_skips_build_stages() -> None:
+    dockerfile = (
+        "FROM --platform=linux/amd64 python:3.13 AS builder\n"
+        "RUN make\n"
+        "from Builder as tested\n"
+        "FROM tested\n"
+        "FROM alpine:latest\n"
+    )
+    assert_that(_from_images(dockerfile)).is_equal_to({"python:3.13", "alpine:latest"})
+
+
 @pytest.mark.parametrize(
     "image_dir", image_dirs(), ids=[path.name for path in image_dirs()]
 )
-def test_build_docker_image(image_dir: Traversable) -> None:
+@pytest.mark.usefixtures("pulled_base_images")
+def test_build_docker_image(
+    image_dir: Traversable, extracted_dirs: _ExtractedDirs
+) -> None:
     """Build a single Docker image from its directory and assert success."""
-    # Ensure a Dockerfile is present
-    dockerfile = image_dir.joinpath("Dockerfile")
-    assert_that(dockerfile.is_file()).described_as(
+    # Ensure a Dockerfile and image_info.json are present
+    image_files = _image_dir_files(image_dir.name)
+    assert_that(image_files).described_as(
         f"Dockerfile missing in {image_dir.name}"
-    )
-
-    # Ensure image_info.json is present
-    info_json = image_dir.joinpath("image_info.json")
-    assert_that(info_json.is_file()).described_as(
+    ).contains("Dockerfile")
+    assert_that(image_files).described_as(
         f"image_info.json missing in {image_dir.name}"
-    )
+    ).contains("image_info.json")
+    info_json = image_dir.joinpath("image_info.json")
 
     # Load image metadata
-    with info_json.open("r") as f:
-        info = json.load(f)
-    image_name = info.get("image_name")
+    info = _load_image_info(image_dir)
+    image_name = info.get("image_name", "")
     assert_that(image_name).is_not_empty().described_as(
         f"'image_name' missing or empty in {info_json}"
     )
@@ -135,56 +242,80 @@ def test_build_docker_image(image_dir: Traversable) -> None:
     if not info.get("active", False):
         pytest.skip(f"Skipping {image_dir.name} because it is not active")
 
-    ctx: AbstractContextManager[Path | Traversable]
+    build_dir: Path | Traversable = image_dir
     if info.get("extract", False):
-        ctx = importlib.resources.as_file(image_dir)
-    else:
-        ctx = nullcontext(image_dir)
-
-    with ctx as alias_img_dir:
-        # Build the Docker image
-        res1 = subprocess.run(
-            ["docker", "build", "-t", image_name, str(alias_img_dir)],
-            check=False,
-            capture_output=True,
-            text=True,
-        )
-        with soft_assertions():
-            assert_that(res1.returncode).described_as(
-                f"Return code when building {image_name} was not zero. "
-                f"Stderr = {res1.stderr}"
-            ).is_equal_to(0)
-            assert_that(res1.stdout).described_as(
-                f"Failed to build {image_name}: stdout"
-            ).is_equal_to("")
-
-        assert_that(res1.returncode).is_equal_to(0).described_as(
-            f"Failed to build {image_name} in {alias_img_dir}: {res1.stderr}"
-        )
-
-        # Basic test
-        cmd_args = [
-            "docker",
-            "run",
-            "-i",
-            *info.get("run_args", []),
-            "--rm",
-            image_name,
-            "echo",
-            "Hello",
-        ]
-        print(shlex.join(cmd_args))
-        res2 = subprocess.run(
-            cmd_args,
-            check=False,
-            capture_output=True,
-        )
-        with soft_assertions():
-            assert_that(res2.returncode).described_as("returncode").is_equal_to(0)
-            assert_that(res2.stdout.strip()).described_as("stdout").is_equal_to(
-                b"Hello"
-            )
-            assert_that(res2.stderr).described_as("stderr").is_equal_to(b"")
+        build_dir = extracted_dirs[image_dir.name]
+    _build_image(build_dir, image_name)
+
+    # Basic test
+    cmd_args = [
+        "docker",
+        "run",
+        "-i",
+        *info.get("run_args", []),
+        "--rm",
+        image_name,
+        "echo",
+        "Hello",
+    ]
+    print(shlex.join(cmd_args))
+    res2 = subprocess.run(
+        cmd_args,
+        check=False,
+        capture_output=True,
+    )
+    with soft_assertions():
+        assert_that(res2.returncode).described_as("returncode").is_equal_to(0)
+        assert_that(res2.stdout.strip()).described_as("stdout").is_equal_to(b"Hello")
+        assert_that(res2.stderr).described_as("stderr").is_equal_to(b"")
+
+
+def _build_image(build_dir: Path | Traversable, image_name: str) -> None:
+    # Build the Docker image
+    # BuildKit runs independent stages and layer fetches concurrently
+    returncode, stdout_tail, stderr_tail = _run_keeping_tail(
+        ["docker", "build", "-t", image_name, str(build_dir)],
+        env={**os.environ, "DOCKER_BUILDKIT": "1"},
+    )
+    with soft_assertions():
+        assert_that(returncode).described_as(
+            f"Return code when building {image_name} was not zero. "
+            f"Stderr = {stderr_tail}"
+        ).is_equal_to(0)
+        assert_that(stdout_tail).described_as(
+            f"Failed to build {image_name}: stdout"
+        ).is_equal_to("")
+
+    assert_that(returncode).is_equal_to(0).described_as(
+        f"Failed to build {image_name} in {build_dir}: {stderr_tail}"
+    )
+
+
+def _run_keeping_tail(
+    args: list[str], tail_lines: int = 200, env: dict[str, str] | None = None
+) -> tuple[int, str, str]:
+    """Run ``args``, streaming its output and keeping only the last lines.
+
+    Build logs can be megabytes long and only their end matters on failure.
+
+    :param list[str] args: The command to run.
+    :param int tail_lines: How many lines of each stream to keep.
+    :param dict[str, str]|None env: Environment for the command, if not inherited.
+    :return: The return code and the tails of stdout and stderr.
+    :rtype: tuple[int, str, str]
+    """
+    with subprocess.Popen(
+        args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, env=env
+    ) as proc:
+        assert proc.stdout is not None and proc.stderr is not None
+        stdout_tail: deque[str] = deque(maxlen=tail_lines)
+        # Drain stdout on a thread so neither pipe can fill up and block.
+        reader = threading.Thread(target=stdout_tail.extend, args=(proc.stdout,))
+        reader.start()
+        stderr_tail = deque(proc.stderr, maxlen=tail_lines)
+        reader.join()
+        returncode = proc.wait()
+    return returncode, "".join(stdout_tail), "".join(stderr_tail)
 
 
 @pytest.fixture(scope="class")
@@ -206,35 +337,49 @@ def docker_oo_docker_container() -> Generator[tuple[DockerRunner, str]]:
         yield c, host_name
 
 
-def test_dood_parent_docker_runner_root(
-    docker_oo_docker_container: tuple[DockerRunner, str],
-) -> None:
-    runner, host_name = docker_oo_docker_container
-    res = runner.run(["id", "-un"], text=True)
-    with soft_assertions():
-        assert_that(res.returncode).described_as("returncode").is_equal_to(0)
-        assert_that(res.stdout.strip()).described_as("stdout").is_equal_to("root")
-        assert_that(res.stderr).described_as("stderr").is_equal_to("")
+_DOOD_SEPARATOR = "__SEP__"
+_INNER_HOSTNAME_CMD = ["docker", "run", "-i", "--rm", ImageNames.PYTHON_DEV, "hostname"]
 
-    res = runner.run(["pwd"], text=True)
-    with soft_assertions():
-        assert_that(res.returncode).described_as("returncode").is_equal_to(0)
-        # TODO: Why is this?
-        assert_that(res.stdout.strip()).described_as("stdout").is_equal_to(
-            "/home/superuser"
-        )
-        assert_that(res.stderr).described_as("stderr").is_equal_to("")
 
-    res = runner.run(
-        ["docker", "run", "-i", "--rm", ImageNames.PYTHON_DEV, "hostname"], text=True
-    )
+def _dood_probe(*inner_cmd: str) -> list[str]:
+    """Return one shell command printing the user, the cwd and ``inner_cmd``.
+
+    The sections are separated by :data:`_DOOD_SEPARATOR` lines so that a test
+    needs a single exec instead of one per check.
+    """
+    script = f"set -e; id -un; echo {_DOOD_SEPARATOR}; pwd"
+    if inner_cmd:
+        script += f"; echo {_DOOD_SEPARATOR}; {shlex.join(inner_cmd)}"
+    return ["sh", "-c", script]
+
+
+def _assert_dood_probe(
+    res: subprocess.CompletedProcess[str], user: str, cwd: str
+) -> list[str]:
+    """Assert the user and cwd sections of a :func:`_dood_probe` result.
+
+    :return: The stripped output of every section.
+    :rtype: list[str]
+    """
+    sections = [part.strip() for part in res.stdout.split(f"{_DOOD_SEPARATOR}\n")]
     with soft_assertions():
         assert_that(res.returncode).described_as("returncode").is_equal_to(0)
-        inner_host_name = res.stdout.strip()
-        assert_that(res.stdout.strip()).described_as("stdout").is_not_empty()
+        assert_that(sections[0]).described_as("id -un").is_equal_to(user)
+        assert_that(sections[1]).described_as("pwd").is_equal_to(cwd)
         assert_that(res.stderr).described_as("stderr").is_equal_to("")
+    return sections
 
-    assert_that(inner_host_name).is_not_equal_to(host_name)
+
+def test_dood_parent_docker_runner_root(
+    docker_oo_docker_container: tuple[DockerRunner, str],
+) -> None:
+    runner, host_name = docker_oo_docker_container
+    res = runner.run(_dood_probe(*_INNER_HOSTNAME_CMD), text=True)
+    # TODO: Why is the cwd /home/superuser?
+    sections = _assert_dood_probe(res, "root", "/home/superuser")
+    assert_that(sections).is_length(3)
+    assert_that(sections[2]).described_as("inner hostname").is_not_empty()
+    assert_that(sections[2]).is_not_equal_to(host_name)
 
 
 def test_dood_superuser(
@@ -242,31 +387,11 @@ def test_dood_superuser(
 ) -> None:
     runner, host_name = docker_oo_docker_container
     user_view = runner.use_as("superuser")
-    res = user_view.run(["id", "-un"], text=True)
-    with soft_assertions():
-        assert_that(res.returncode).described_as("returncode").is_equal_to(0)
-        assert_that(res.stdout.strip()).described_as("stdout").is_equal_to("superuser")
-        assert_that(res.stderr).described_as("stderr").is_equal_to("")
-
-    res = user_view.run(["pwd"], text=True)
-    with soft_assertions():
-        assert_that(res.returncode).described_as("returncode").is_equal_to(0)
-        assert_that(res.stdout.strip()).described_as("stdout").is_equal_to(
-            "/home/superuser"
-        )
-        assert_that(res.stderr).described_as("stderr").is_equal_to("")
-
-    res = user_view.run(
-        ["sudo", "docker", "run", "-i", "--rm", ImageNames.PYTHON_DEV, "hostname"],
-        text=True,
-    )
-    with soft_assertions():
-        assert_that(res.returncode).described_as("returncode").is_equal_to(0)
-        inner_host_name = res.stdout.strip()
-        assert_that(res.stdout.strip()).described_as("stdout").is_not_empty()
-        assert_that(res.stderr).described_as("stderr").is_equal_to("")
-
-    assert_that(inner_host_name).is_not_equal_to(host_name)
+    res = user_view.run(_dood_probe("sudo", *_INNER_HOSTNAME_CMD), text=True)
+    sections = _assert_dood_probe(res, "superuser", "/home/superuser")
+    assert_that(sections).is_length(3)
+    assert_that(sections[2]).described_as("inner hostname").is_not_empty()
+    assert_that(sections[2]).is_not_equal_to(host_name)
 
 
 def test_dood_dockeruser(
@@ -274,25 +399,11 @@ def test_dood_dockeruser(
 ) -> None:
     runner, host_name = docker_oo_docker_container
     user_view = runner.use_as("dockeruser")
-    res = user_view.run(["id", "-un"], text=True)
-    with soft_assertions():
-        assert_that(res.returncode).described_as("returncode").is_equal_to(0)
-        assert_that(res.stdout.strip()).described_as("stdout").is_equal_to("dockeruser")
-        assert_that(res.stderr).described_as("stderr").is_equal_to("")
-
-    res = user_view.run(["pwd"], text=True)
-    with soft_assertions():
-        assert_that(res.returncode).described_as("returncode").is_equal_to(0)
-        assert_that(res.stdout.strip()).described_as("stdout").is_equal_to(
-            "/home/dockeruser"
-        )
-        assert_that(res.stderr).described_as("stderr").is_equal_to("")
+    res = user_view.run(_dood_probe(), text=True)
+    _assert_dood_probe(res, "dockeruser", "/home/dockeruser")
 
     # This should succeed though dockeruser cannot sudo
-    res = runner.run(
-        ["docker", "run", "-i", "--rm", ImageNames.PYTHON_DEV, "hostname"],
-        text=True,
-    )
+    res = runner.run(_INNER_HOSTNAME_CMD, text=True)
     with soft_assertions():
         assert_that(res.returncode).described_as("returncode").is_equal_to(0)
         inner_host_name = res.stdout.strip()
@@ -1,14 +1,18 @@
+from collections.abc import Callable
 from collections.abc import Generator
+from contextlib import ExitStack
 import hashlib
-import os
+import io
 from pathlib import Path
+from pathlib import PurePosixPath
 import posixpath
 import re
 import shlex
 import subprocess
-import tempfile
+import tarfile
 import time
 from typing import BinaryIO
+import uuid
 
 from assertpy import assert_that
 from assertpy import soft_assertions
@@ -19,6 +23,9 @@ from am_common_lib.docker_util.docker_runner import DockerRunner
 from am_common_lib.docker_util.docker_runner import DockerRunnerUserView
 
 
+# Every test here starts containers
+pytestmark = pytest.mark.usefixtures("pulled_registry_images")
+
 COMMON_IMAGE_NAMES = [
     ImageNames.ALPINE_LATEST,
     ImageNames.BUSYBOX_LATEST,
@@ -68,13 +75,22 @@ def test_mysql_different_versions(version: str) -> None:
     ) as db:
         container_name = db.container_name
 
-        # Wait up to 120 s for MySQL to become available
-        wait_until_ns = time.monotonic_ns() + 120 * 1_000_000_000
-        while time.monotonic_ns() < wait_until_ns:
-            res = db.run(["mysqladmin", "ping", "--silent"])
+        # Wait up to 120 s for MySQL to become available, backing off from 50 ms to
+        # 1 s between pings
+        wait_until = time.monotonic() + 120
+        delay = 0.05
+        while time.monotonic() < wait_until:
+            # Only the exit status matters, so don't pipe the output back
+            res = db.run(
+                ["mysqladmin", "ping", "--silent"],
+                capture_output=False,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
             if res.returncode == 0:
                 break
-            time.sleep(0.2)
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
         else:
             pytest.fail("MySQL did not start in time")
 
@@ -160,6 +176,32 @@ def assert_that_container_is_running(container_name: str) -> None:
     assert_that(all_containers).contains(container_name)
 
 
+@pytest.fixture(scope="session")
+def shared_runner() -> Generator[Callable[[str], DockerRunner]]:
+    """Yield a factory returning one long-lived container per image.
+
+    Tests that neither depend on a fresh container nor check its lifecycle share
+    it, instead of paying for a ``docker run`` and handshake each. They must
+    work below a :func:`_fresh_dir` so they do not see each other's files.
+    """
+    runners: dict[str, DockerRunner] = {}
+    with ExitStack() as stack:
+
+        def get(image: str) -> DockerRunner:
+            if image not in runners:
+                runners[image] = stack.enter_context(DockerRunner(image))
+            return runners[image]
+
+        yield get
+
+
+def _fresh_dir(c: DockerRunner) -> str:
+    """Create a directory no other test uses below the default user's cwd."""
+    path = posixpath.join(c.default_view.getcwd(), f"t_{uuid.uuid4().hex}")
+    c.run(["mkdir", "-p", path], check=True)
+    return path
+
+
 # ----------------------------------------------------------------------
 # DockerRunner.copy_from tests
 # ----------------------------------------------------------------------
@@ -169,107 +211,70 @@ def assert_that_container_is_running(container_name: str) -> None:
     "image",
     COMMON_IMAGE_NAMES,
 )
-def test_file_copy_from(image: str) -> None:
-    with DockerRunner(image) as c:
-        default_view = c.default_view
-        base_path = default_view.getcwd()
-        filename = "from_container.txt"
-        container_path = posixpath.join(base_path, filename)
-        content = "Data from container"
-
-        # Create the file inside the container
-        res = c.run(
-            [
-                "sh",
-                "-c",
-                shlex.join(["echo", "-n", content])
-                + " > "
-                + shlex.quote(container_path),
-            ]
-        )
-        with soft_assertions():
-            assert_that(res.returncode).described_as("returncode").is_equal_to(0)
-            assert_that(res.stdout).described_as("stdout").is_equal_to(b"")
-            assert_that(res.stderr).described_as("stderr").is_equal_to(b"")
+def test_file_copy_from(
+    image: str, shared_runner: Callable[[str], DockerRunner], tmp_path: Path
+) -> None:
+    c = shared_runner(image)
+    base_path = _fresh_dir(c)
+    filename = "from_container.txt"
+    container_path = posixpath.join(base_path, filename)
+    # Not valid UTF-8, so that any text round trip would show
+    content = b"Data from container\x00\xff"
 
-        # Copy the file out and read it into memory
-        with tempfile.TemporaryDirectory() as host_dir:
-            host_path = os.path.join(host_dir, filename)
-            c.copy_from(container_path, host_path)
+    # Create the file inside the container
+    _seed_container_tree(c, base_path, {filename: content})
 
-            with open(host_path, "rb") as f:
-                copied = f.read()
+    # Copy the file out and read it into memory
+    host_path = tmp_path / filename
+    c.copy_from(container_path, str(host_path))
 
-        assert_that(copied).is_equal_to(content.encode("utf-8"))
+    assert_that(host_path.read_bytes()).is_equal_to(content)
 
 
 @pytest.mark.parametrize(
     "image",
     COMMON_IMAGE_NAMES,
 )
-def test_folder_copy_from(image: str) -> None:
-    with DockerRunner(image) as c:
-        default_view = c.default_view
-        base_path = default_view.getcwd()
-        folder_name = "test_dir"
-        container_folder = posixpath.join(base_path, folder_name)
-
-        # Make the directory in the container
-        res = c.run(["mkdir", "-p", container_folder])
-        assert_that(res.returncode).is_equal_to(0)
+def test_folder_copy_from(
+    image: str, shared_runner: Callable[[str], DockerRunner], tmp_path: Path
+) -> None:
+    c = shared_runner(image)
+    base_path = _fresh_dir(c)
+    folder_name = "test_dir"
+    container_folder = posixpath.join(base_path, folder_name)
+
+    # Create a couple of files and a nested subdir
+    files = {
+        "file1.txt": b"First file",
+        "file2.txt": b"Second file",
+        "nested/sub.txt": b"In the subdirectory",
+    }
+    _seed_container_tree(
+        c, base_path, {f"{folder_name}/{rel}": data for rel, data in files.items()}
+    )
+
+    # Copy the contents out and verify that it was copied correctly
+    c.copy_from(container_folder, str(tmp_path))
+
+    host_root = tmp_path / folder_name
+    assert_that(host_root.is_dir()).is_true()
 
-        # Create a couple of files and a nested subdir
-        files = {
-            "file1.txt": b"First file",
-            "file2.txt": b"Second file",
-            "nested/sub.txt": b"In the subdirectory",
-        }
-        for rel, content in files.items():
-            remote_path = posixpath.join(container_folder, rel)
-            # ensure parent exists
-            parent = posixpath.dirname(remote_path)
-            if parent:
-                mkdir_res = c.run(["mkdir", "-p", parent])
-                assert_that(mkdir_res.returncode).described_as(
-                    f"mkdir {parent}"
-                ).is_equal_to(0)
-            # Write the file
-            cmd = [
-                "sh",
-                "-c",
-                shlex.join(["printf", "%s", content.decode("utf-8")])
-                + " > "
-                + shlex.quote(remote_path),
-            ]
-            write_res = c.run(cmd)
-            assert_that(write_res.returncode).described_as(
-                f"writing {rel}"
-            ).is_equal_to(0)
-
-        # Copy the contents out and verify that it was copied correctly
-        with tempfile.TemporaryDirectory() as host_dir:
-            c.copy_from(container_folder, host_dir)
-
-            host_root = os.path.join(host_dir, folder_name)
-            assert_that(os.path.isdir(host_root)).is_true()
-
-            for rel, content in files.items():
-                parts = rel.split("/")
-                host_file = os.path.join(host_root, *parts)
-                assert_that(os.path.isfile(host_file)).described_as(
-                    f"{rel} exists"
-                ).is_true()
-                with open(host_file, "rb") as f:
-                    data = f.read()
-                assert_that(data).described_as(f"{rel} content").is_equal_to(content)
+    for rel, content in files.items():
+        host_file = host_root / rel
+        assert_that(host_file.is_file()).described_as(f"{rel} exists").is_true()
+        assert_that(host_file.read_bytes()).described_as(f"{rel} content").is_equal_to(
+            content
+        )
 
 
 @pytest.mark.parametrize("image", COMMON_IMAGE_NAMES)
-def test_copy_from_nonexistent(image: str) -> None:
-    with DockerRunner(image) as c, tempfile.TemporaryDirectory() as td:
-        dest = os.path.join(td, "missing.txt")
-        with pytest.raises(subprocess.CalledProcessError):
-            c.copy_from("/no/such/path.txt", dest)
+def test_copy_from_nonexistent(
+    image: str, shared_runner: Callable[[str], DockerRunner], tmp_path: Path
+) -> None:
+    c = shared_runner(image)
+    dest = str(tmp_path / "missing.txt")
+    with pytest.raises(subprocess.CalledProcessError):
+        c.copy_from("/no/such/path.txt", dest)
 
 
 # ----------------------------------------------------------------------
@@ -277,123 +282,82 @@ def test_copy_from_nonexistent(image: str) -> None:
 # ----------------------------------------------------------------------
 
 
-@pytest.mark.parametrize(
-    "image,relative_src",
-    [
-        pytest.param(
-            image,
-            relative_src,
-            id=f"{image}; relative_src={relative_src}",
+@pytest.mark.parametrize("relative_src", [False, True], ids="relative_src={}".format)
+@pytest.mark.parametrize("image", COMMON_IMAGE_NAMES)
+def test_copy_to_single_file_source_paths(
+    image: str,
+    relative_src: bool,
+    shared_runner: Callable[[str], DockerRunner],
+    tmp_path: Path,
+) -> None:
+    c = shared_runner(image)
+    base_path = _fresh_dir(c)
+    content = b"hello container"
+    src_file = tmp_path / "src.txt"
+    src_file.write_bytes(content)
+    # Relative sources are resolved against cwd, without touching the process cwd
+    src = Path("src.txt") if relative_src else src_file
+    dest = posixpath.join(base_path, "copied.txt")
+    res = c.copy_to(src, dest, cwd=tmp_path if relative_src else None)
+    with soft_assertions():
+        assert_that(res.returncode).described_as("returncode").is_equal_to(0)
+        assert_that(res.stdout).described_as("stdout").is_equal_to("")
+        assert_that(res.stderr).described_as("stderr").is_equal_to("")
+
+    res = c.run(["cat", dest], text=True, check=True)
+    with soft_assertions():
+        assert_that(res.returncode).described_as("returncode").is_equal_to(0)
+        assert_that(res.stdout).described_as("stdout").is_equal_to(
+            content.decode("utf-8")
         )
-        for image in COMMON_IMAGE_NAMES
-        for relative_src in [False, True]
-    ],
-)
-def test_copy_to_single_file_source_paths(image: str, relative_src: str) -> None:
-    with DockerRunner(image) as c:
-        base_path = c.default_view.getcwd()
-        content = b"hello container"
-        with tempfile.TemporaryDirectory() as tmpdir:
-            src_file = os.path.join(tmpdir, "src.txt")
-            with open(src_file, "wb") as f:
-                f.write(content)
-            old_cwd = os.getcwd()
-            try:
-                if relative_src:
-                    os.chdir(tmpdir)
-                    src = "src.txt"
-                else:
-                    src = src_file
-                dest = posixpath.join(base_path, "copied.txt")
-                res = c.copy_to(src, dest)
-                with soft_assertions():
-                    assert_that(res.returncode).described_as("returncode").is_equal_to(
-                        0
-                    )
-                    assert_that(res.stdout).described_as("stdout").is_equal_to("")
-                    assert_that(res.stderr).described_as("stderr").is_equal_to("")
-            finally:
-                os.chdir(old_cwd)
-
-            res = c.run(["cat", dest], text=True, check=True)
-            with soft_assertions():
-                assert_that(res.returncode).described_as("returncode").is_equal_to(0)
-                assert_that(res.stdout).described_as("stdout").is_equal_to(
-                    content.decode("utf-8")
-                )
-                assert_that(res.stderr).described_as("stderr").is_equal_to("")
+        assert_that(res.stderr).described_as("stderr").is_equal_to("")
 
 
-@pytest.mark.parametrize(
-    "image,relative_src",
-    [
-        pytest.param(
-            image,
-            relative_src,
-            id=f"{image}; relative_src={relative_src}",
-        )
-        for image in COMMON_IMAGE_NAMES
-        for relative_src in [False, True]
-    ],
-)
-def test_copy_to_directory_source_paths(image: str, relative_src: str) -> None:
-    with DockerRunner(image) as c:
-        base_path = c.default_view.getcwd()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            src_dir_name = "src_dir"
-            host_src = os.path.join(tmpdir, src_dir_name)
-            files = {
-                "file1.txt": b"First file",
-                "nested/sub.txt": b"Nested file",
-            }
-            # Create files on host
-            for rel, content in files.items():
-                host_file = os.path.join(host_src, rel)
-                os.makedirs(os.path.dirname(host_file), exist_ok=True)
-                with open(host_file, "wb") as f:
-                    f.write(content)
-
-            # Decide whether to use a relative or absolute path
-            old_cwd = os.getcwd()
-            try:
-                if relative_src:
-                    os.chdir(tmpdir)
-                    src = src_dir_name
-                else:
-                    src = host_src
-
-                dest = posixpath.join(base_path, "copied_dir")
-                res = c.copy_to(src, dest)
-
-                # copy_to should succeed with no output
-                with soft_assertions():
-                    assert_that(res.returncode).described_as("returncode").is_equal_to(
-                        0
-                    )
-                    assert_that(res.stdout).described_as("stdout").is_equal_to("")
-                    assert_that(res.stderr).described_as("stderr").is_equal_to("")
-            finally:
-                os.chdir(old_cwd)
-
-        # Now verify inside the container that each file exists
-        # and has the right contents
-        for rel, content in files.items():
-            remote_path = posixpath.join(dest, rel)
-            res = c.run(["cat", remote_path], text=True, check=True)
-            with soft_assertions():
-                assert_that(res.returncode).described_as(
-                    f"{rel} returncode"
-                ).is_equal_to(0)
-                assert_that(res.stdout).described_as(f"{rel} stdout").is_equal_to(
-                    content.decode("utf-8")
-                )
-                assert_that(res.stderr).described_as(f"{rel} stderr").is_empty()
+@pytest.mark.parametrize("relative_src", [False, True], ids="relative_src={}".format)
+@pytest.mark.parametrize("image", COMMON_IMAGE_NAMES)
+def test_copy_to_directory_source_paths(
+    image: str,
+    relative_src: bool,
+    shared_runner: Callable[[str], DockerRunner],
+    tmp_path: Path,
+) -> None:
+    c = shared_runner(image)
+    base_path = _fresh_dir(c)
+
+    src_dir_name = "src_dir"
+    host_src = tmp_path / src_dir_name
+    files = {
+        "file1.txt": b"First file",
+        "nested/sub.txt": b"Nested file",
+    }
+    # Create files on host
+    for rel, content in files.items():
+        host_file = host_src / rel
+        host_file.parent.mkdir(parents=True, exist_ok=True)
+        host_file.write_bytes(content)
+
+    # Decide whether to use a relative or absolute path
+    src = Path(src_dir_name) if relative_src else host_src
+    dest = posixpath.join(base_path, "copied_dir")
+    res = c.copy_to(src, dest, cwd=tmp_path if relative_src else None)
+
+    # copy_to should succeed with no output
+    with soft_assertions():
+        assert_that(res.returncode).described_as("returncode").is_equal_to(0)
+        assert_that(res.stdout).described_as("stdout").is_equal_to("")
+        assert_that(res.stderr).described_as("stderr").is_equal_to("")
+
+    # Now verify inside the container that each file exists
+    # and has the right contents
+    assert_that(_read_container_files(c, dest, list(files))).is_equal_to(files)
 
 
 @pytest.mark.parametrize("image", COMMON_IMAGE_NAMES)
-def test_copy_to_nonexistent_source_raises(image: str) -> None:
-    with DockerRunner(image) as c, pytest.raises(subprocess.CalledProcessError):
+def test_copy_to_nonexistent_source_raises(
+    image: str, shared_runner: Callable[[str], DockerRunner]
+) -> None:
+    c = shared_runner(image)
+    with pytest.raises(subprocess.CalledProcessError):
         c.copy_to("no_such_src.txt", "/")
 
 
@@ -410,15 +374,17 @@ def test_copy_to_nonexistent_source_raises(image: str) -> None:
         for workdir in (None, "test_open_wd")
     ],
 )
-def test_open_read_nonexistent_raises(image: str, workdir: str | None) -> None:
-    with DockerRunner(image) as c:
-        if workdir:
-            c.run(["mkdir", "-p", workdir], check=True)
+def test_open_read_nonexistent_raises(
+    image: str, workdir: str | None, shared_runner: Callable[[str], DockerRunner]
+) -> None:
+    c = shared_runner(image)
+    if workdir:
+        c.run(["mkdir", "-p", workdir], check=True)
 
-        with pytest.raises(FileNotFoundError):
-            # the context‐manager __enter__ will error if the file doesn't exist
-            with c.open("no_such_file.txt", mode="rb", workdir=workdir):
-                pass
+    with pytest.raises(FileNotFoundError):
+        # the context‐manager __enter__ will error if the file doesn't exist
+        with c.open("no_such_file.txt", mode="rb", workdir=workdir):
+            pass
 
 
 @pytest.mark.parametrize(
@@ -429,61 +395,63 @@ def test_open_read_nonexistent_raises(image: str, workdir: str | None) -> None:
         for wd in (True, False)
     ],
 )
-def test_open_write_and_read(image: str, workdir_flag: bool) -> None:
+def test_open_write_and_read(
+    image: str, workdir_flag: bool, shared_runner: Callable[[str], DockerRunner]
+) -> None:
     content1 = b"hello via open"
     content2 = b"; goodbye"
     subdir1 = "foo"
     subdir2 = "bar"
     filename = "testfile.txt"
 
-    with DockerRunner(image) as c:
-        base_path = c.default_view.getcwd()
-        full_dir = posixpath.join(base_path, subdir1, subdir2)
-        c.run(["mkdir", "-p", full_dir], check=True)
-
-        def assert_writing(wf: BinaryIO) -> None:
-            assert_that(wf.isatty()).is_false()
-            assert_that(wf.mode).is_equal_to("wb")
-            assert_that(wf.writable()).is_true()
-            assert_that(wf.readable()).is_false()
-            assert_that(wf.seekable()).is_false()
-            assert_that(wf.write(content1)).is_equal_to(len(content1))
-            assert_that(wf.write(content2)).is_equal_to(len(content2))
-
-        def assert_reading(rf: BinaryIO) -> None:
-            assert_that(rf.isatty()).is_false()
-            assert_that(rf.mode).is_equal_to("rb")
-            assert_that(rf.writable()).is_false()
-            assert_that(rf.readable()).is_true()
-            assert_that(rf.seekable()).is_false()
-            part1 = rf.read(5)
-            assert_that(part1).is_equal_to(content1[:5])
-            part2 = rf.read()
-            assert_that(part1 + part2).is_equal_to(content1 + content2)
-
-        if workdir_flag:
-            # CASE A: supply workdir + relative path
-            workdir = posixpath.join(base_path, subdir1)
-            rel_path = f"{subdir2}/{filename}"
-
-            with c.open(rel_path, mode="wb", workdir=workdir) as f:
-                assert_writing(f)
-
-            expected = posixpath.join(full_dir, filename)
-            c.run(["test", "-f", expected], check=True)
-
-            with c.open(rel_path, mode="rb", workdir=workdir) as f:
-                assert_reading(f)
-        else:
-            # CASE B: no workdir, absolute path
-            abs_path = posixpath.join(full_dir, filename)
-
-            with c.open(abs_path, mode="wb") as f:
-                assert_writing(f)
-
-            c.run(["test", "-f", abs_path], check=True)
-            with c.open(abs_path, mode="rb") as f:
-                assert_reading(f)
+    c = shared_runner(image)
+    base_path = _fresh_dir(c)
+    full_dir = posixpath.join(base_path, subdir1, subdir2)
+    c.run(["mkdir", "-p", full_dir], check=True)
+
+    def assert_writing(wf: BinaryIO) -> None:
+        assert_that(wf.isatty()).is_false()
+        assert_that(wf.mode).is_equal_to("wb")
+        assert_that(wf.writable()).is_true()
+        assert_that(wf.readable()).is_false()
+        assert_that(wf.seekable()).is_false()
+        assert_that(wf.write(content1)).is_equal_to(len(content1))
+        assert_that(wf.write(content2)).is_equal_to(len(content2))
+
+    def assert_reading(rf: BinaryIO) -> None:
+        assert_that(rf.isatty()).is_false()
+        assert_that(rf.mode).is_equal_to("rb")
+        assert_that(rf.writable()).is_false()
+        assert_that(rf.readable()).is_true()
+        assert_that(rf.seekable()).is_false()
+        part1 = rf.read(5)
+        assert_that(part1).is_equal_to(content1[:5])
+        part2 = rf.read()
+        assert_that(part1 + part2).is_equal_to(content1 + content2)
+
+    if workdir_flag:
+        # CASE A: supply workdir + relative path
+        workdir = posixpath.join(base_path, subdir1)
+        rel_path = f"{subdir2}/{filename}"
+
+        with c.open(rel_path, mode="wb", workdir=workdir) as f:
+            assert_writing(f)
+
+        expected = posixpath.join(full_dir, filename)
+        c.run(["test", "-f", expected], check=True)
+
+        with c.open(rel_path, mode="rb", workdir=workdir) as f:
+            assert_reading(f)
+    else:
+        # CASE B: no workdir, absolute path
+        abs_path = posixpath.join(full_dir, filename)
+
+        with c.open(abs_path, mode="wb") as f:
+            assert_writing(f)
+
+        c.run(["test", "-f", abs_path], check=True)
+        with c.open(abs_path, mode="rb") as f:
+            assert_reading(f)
 
 
 # ----------------------------------------------------------------------
@@ -492,65 +460,73 @@ def test_open_write_and_read(image: str, workdir_flag: bool) -> None:
 
 
 @pytest.mark.parametrize("image", COMMON_IMAGE_NAMES)
-def test_makedirs_creates_nested_dirs(image: str) -> None:
-    with DockerRunner(image) as c:
-        base = c.default_view.getcwd()
-        path = posixpath.join(base, "foo", "bar", "baz")
-        c.makedirs(path)
-        # Verify the deepest directory was created
-        c.run(["test", "-d", path], check=True)
+def test_makedirs_creates_nested_dirs(
+    image: str, shared_runner: Callable[[str], DockerRunner]
+) -> None:
+    c = shared_runner(image)
+    base = _fresh_dir(c)
+    path = posixpath.join(base, "foo", "bar", "baz")
+    c.makedirs(path)
+    # Verify the deepest directory was created
+    c.run(["test", "-d", path], check=True)
 
 
 @pytest.mark.parametrize("image", COMMON_IMAGE_NAMES)
-def test_makedirs_exist_ok_false_raises(image: str) -> None:
-    with DockerRunner(image) as c:
-        base = c.default_view.getcwd()
-        dup = posixpath.join(base, "dupdir")
-        # First creation succeeds
-        c.makedirs(dup)
-        # Second without -p should fail
-        with pytest.raises(subprocess.CalledProcessError):
-            c.makedirs(dup, exist_ok=False)
+def test_makedirs_exist_ok_false_raises(
+    image: str, shared_runner: Callable[[str], DockerRunner]
+) -> None:
+    c = shared_runner(image)
+    base = _fresh_dir(c)
+    dup = posixpath.join(base, "dupdir")
+    # First creation succeeds
+    c.makedirs(dup)
+    # Second without -p should fail
+    with pytest.raises(subprocess.CalledProcessError):
+        c.makedirs(dup, exist_ok=False)
 
 
 @pytest.mark.parametrize("image", COMMON_IMAGE_NAMES)
-def test_makedirs_with_workdir_relative(image: str) -> None:
-    with DockerRunner(image) as c:
-        base = c.default_view.getcwd()
-        # Create a nested path relative to workdir
-        rel = "rel1/rel2"
-        c.makedirs(rel, workdir=base)
-        full = posixpath.join(base, rel)
-        c.run(["test", "-d", full], check=True)
+def test_makedirs_with_workdir_relative(
+    image: str, shared_runner: Callable[[str], DockerRunner]
+) -> None:
+    c = shared_runner(image)
+    base = _fresh_dir(c)
+    # Create a nested path relative to workdir
+    rel = "rel1/rel2"
+    c.makedirs(rel, workdir=base)
+    full = posixpath.join(base, rel)
+    c.run(["test", "-d", full], check=True)
 
 
 @pytest.mark.parametrize("image", [ImageNames.PYTHON_DEV, ImageNames.PYTHON_DEV_LOADED])
 @pytest.mark.parametrize("user", ["basicuser", "superuser"])
-def test_makedirs_with_user(image: str, user: str) -> None:
-    with DockerRunner(image) as c:
-        base_path = Path("/", "home", user)
-        target1 = (base_path / "new-directory").as_posix()
-        c.makedirs(target1, user=user)
-        c.run(["test", "-d", target1], user=user, check=True)
-        target2 = (base_path / "foo" / "bar").as_posix()
-        c.makedirs(target2, user=user)
-        c.run(["test", "-d", target2], user=user, check=True)
-
-        # Verify ownership
-        res = c.run(
-            ["stat", "-c", "%U", (base_path / "foo").as_posix()],
-            user=user,
-            text=True,
-            check=True,
-        )
-        assert_that(res.stdout.strip()).is_equal_to(user)
-        res = c.run(
-            ["stat", "-c", "%U", (base_path / "foo" / "bar").as_posix()],
-            user=user,
-            text=True,
-            check=True,
-        )
-        assert_that(res.stdout.strip()).is_equal_to(user)
+def test_makedirs_with_user(
+    image: str, user: str, shared_runner: Callable[[str], DockerRunner]
+) -> None:
+    c = shared_runner(image)
+    base_path = Path("/", "home", user, f"t_{uuid.uuid4().hex}")
+    target1 = (base_path / "new-directory").as_posix()
+    c.makedirs(target1, user=user)
+    c.run(["test", "-d", target1], user=user, check=True)
+    target2 = (base_path / "foo" / "bar").as_posix()
+    c.makedirs(target2, user=user)
+    c.run(["test", "-d", target2], user=user, check=True)
+
+    # Verify ownership
+    res = c.run(
+        ["stat", "-c", "%U", (base_path / "foo").as_posix()],
+        user=user,
+        text=True,
+        check=True,
+    )
+    assert_that(res.stdout.strip()).is_equal_to(user)
+    res = c.run(
+        ["stat", "-c", "%U", (base_path / "foo" / "bar").as_posix()],
+        user=user,
+        text=True,
+        check=True,
+    )
+    assert_that(res.stdout.strip()).is_equal_to(user)
 
 
 # ======================================================================
@@ -589,73 +565,63 @@ def test_chdir_changes_cwd(user_view_rw_operations: DockerRunnerUserView) -> Non
 
 
 def test_copy_to_preserves_ownership(
-    user_view_rw_operations: DockerRunnerUserView,
+    user_view_rw_operations: DockerRunnerUserView, tmp_path: Path
 ) -> None:
     user_view = user_view_rw_operations
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        tmp_path = Path(tmp_dir)
-        file_on_host = tmp_path / "owned.txt"
-        file_on_host.write_text("Check me")
+    file_on_host = tmp_path / "owned.txt"
+    file_on_host.write_text("Check me")
 
-        dest_path = "/home/basicuser/owned.txt"
-        user_view.copy_to(file_on_host, dest_path)
+    dest_path = "/home/basicuser/owned.txt"
+    user_view.copy_to(file_on_host, dest_path)
 
-        result = user_view.run(["stat", "-c", "%U", dest_path], text=True)
-        assert_that(result.stdout.strip()).is_equal_to("basicuser")
+    result = user_view.run(["stat", "-c", "%U", dest_path], text=True)
+    assert_that(result.stdout.strip()).is_equal_to("basicuser")
 
 
 def test_user_view_copy_to_directory(
-    user_view_rw_operations: DockerRunnerUserView,
+    user_view_rw_operations: DockerRunnerUserView, tmp_path: Path
 ) -> None:
     user_view = user_view_rw_operations
     # Prepare a host directory with some files
-    with tempfile.TemporaryDirectory() as tmpdir:
-        host_src = Path(tmpdir) / "src_dir"
-        files = {
-            "a.txt": b"First",
-            "sub/b.txt": b"Second",
-        }
-        for rel, content in files.items():
-            path = host_src / rel
-            path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_bytes(content)
+    host_src = tmp_path / "src_dir"
+    files = {
+        "a.txt": b"First",
+        "sub/b.txt": b"Second",
+    }
+    for rel, content in files.items():
+        path = host_src / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
 
-        # Copy the directory into the container
-        dest = posixpath.join(user_view.getcwd(), "dest_dir")
-        user_view.copy_to(host_src, dest)
+    # Copy the directory into the container
+    dest = posixpath.join(user_view.getcwd(), "dest_dir")
+    user_view.copy_to(host_src, dest)
 
     # Verify each file is present in the container with correct contents
-    for rel, content in files.items():
-        remote = posixpath.join(dest, rel)
-        res = user_view.run(["cat", remote], text=True, check=True)
-        with soft_assertions():
-            assert_that(res.returncode).is_equal_to(0)
-            assert_that(res.stdout).is_equal_to(content.decode("utf-8"))
-            assert_that(res.stderr).is_equal_to("")
+    assert_that(_read_container_files(user_view, dest, list(files))).is_equal_to(files)
 
 
 def test_user_view_copy_to_directory_preserves_ownership(
-    user_view_rw_operations: DockerRunnerUserView,
+    user_view_rw_operations: DockerRunnerUserView, tmp_path: Path
 ) -> None:
     user_view = user_view_rw_operations
     username = user_view.username  # e.g. "basicuser"
 
     # Prepare a small nested host directory
-    with tempfile.TemporaryDirectory() as tmpdir:
-        host_src = Path(tmpdir) / "nested_src"
-        files = {
-            "top.txt": b"top level",
-            "subdir/mid.txt": b"in subdir",
-            "subdir/deeper/deep.txt": b"deep level",
-        }
-        for rel, content in files.items():
-            p = host_src / rel
-            p.parent.mkdir(parents=True, exist_ok=True)
-            p.write_bytes(content)
+    host_src = tmp_path / "nested_src"
+    files = {
+        "top.txt": b"top level",
+        "subdir/mid.txt": b"in subdir",
+        "subdir/deeper/deep.txt": b"deep level",
+    }
+    for rel, content in files.items():
+        p = host_src / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_bytes(content)
 
-        # Copy into container
-        dest = posixpath.join(user_view.getcwd(), "owned_dest")
-        user_view.copy_to(host_src, dest)
+    # Copy into container
+    dest = posixpath.join(user_view.getcwd(), "owned_dest")
+    user_view.copy_to(host_src, dest)
 
     to_check = [
         "",
@@ -665,19 +631,15 @@ def test_user_view_copy_to_directory_preserves_ownership(
         "subdir/mid.txt",
         "subdir/deeper/deep.txt",
     ]
-    for rel in to_check:
-        path = posixpath.join(dest, rel) if rel else dest
-        result = user_view.run(
-            ["stat", "-c", "%U", path],
-            text=True,
-            check=True,
-        )
-        # stat -c %U prints the owner username
-        assert_that(result.stdout.strip()).is_equal_to(username)
+    assert_that(_owners(user_view, dest, to_check)).is_equal_to(
+        dict.fromkeys(to_check, username)
+    )
 
 
 @pytest.mark.parametrize("image", COMMON_IMAGE_NAMES)
-def test_root_view_copy_to_directory_preserves_ownership(image: str) -> None:
+def test_root_view_copy_to_directory_preserves_ownership(
+    image: str, tmp_path: Path
+) -> None:
     with DockerRunner(image) as runner:
         # Create a root user view with workdir set to /root
         root_view = runner.use_as("root", workdir="/root")
@@ -685,23 +647,22 @@ def test_root_view_copy_to_directory_preserves_ownership(image: str) -> None:
         assert_that(username).is_equal_to("root")
 
         # Create a temporary directory on host with nested structure
-        with tempfile.TemporaryDirectory() as tmpdir:
-            host_src = Path(tmpdir) / "nested_src"
-            files = {
-                "top.txt": b"top level",
-                "subdir/mid.txt": b"in subdir",
-                "subdir/deeper/deep.txt": b"deep level",
-            }
-
-            # Create files in temporary directory
-            for rel, content in files.items():
-                p = host_src / rel
-                p.parent.mkdir(parents=True, exist_ok=True)
-                p.write_bytes(content)
-
-            # Copy into container using root view
-            dest = posixpath.join(root_view.getcwd(), "owned_dest")
-            root_view.copy_to(host_src, dest)
+        host_src = tmp_path / "nested_src"
+        files = {
+            "top.txt": b"top level",
+            "subdir/mid.txt": b"in subdir",
+            "subdir/deeper/deep.txt": b"deep level",
+        }
+
+        # Create files in temporary directory
+        for rel, content in files.items():
+            p = host_src / rel
+            p.parent.mkdir(parents=True, exist_ok=True)
+            p.write_bytes(content)
+
+        # Copy into container using root view
+        dest = posixpath.join(root_view.getcwd(), "owned_dest")
+        root_view.copy_to(host_src, dest)
 
         # Verify ownership of all paths
         paths_to_check = [
@@ -713,14 +674,9 @@ def test_root_view_copy_to_directory_preserves_ownership(image: str) -> None:
             "subdir/deeper/deep.txt",
         ]
 
-        for rel in paths_to_check:
-            path = posixpath.join(dest, rel) if rel else dest
-            result = root_view.run(
-                ["stat", "-c", "%U", path],
-                text=True,
-                check=True,
-            )
-            assert_that(result.stdout.strip()).is_equal_to(username)
+        assert_that(_owners(root_view, dest, paths_to_check)).is_equal_to(
+            dict.fromkeys(paths_to_check, username)
+        )
 
 
 def test_user_view_write_file_and_file_exists(
@@ -760,11 +716,64 @@ def test_user_view_read_file_returns_expected_bytes(
 
 
 def _sha256(p: Path) -> str:
-    h = hashlib.sha256()
     with p.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _read_container_files(
+    runner: DockerRunner | DockerRunnerUserView, base: str, rels: list[str]
+) -> dict[str, bytes]:
+    """Map each path in `rels`, relative to `base`, to the contents of that file in
+    the container, reading them all with a single exec.
+
+    Every file is preceded by an ASCII record separator, which the test contents
+    never contain.
+    """
+    script = "; ".join(
+        f"printf '\\036' && cat {shlex.quote(posixpath.join(base, rel))}"
+        for rel in rels
+    )
+    res = runner.run(["sh", "-c", f"set -e; {script}"], check=True)
+    assert_that(res.stderr).described_as("stderr").is_empty()
+    return dict(zip(rels, res.stdout.split(b"\x1e")[1:], strict=True))
+
+
+def _owners(view: DockerRunnerUserView, base: str, rels: list[str]) -> dict[str, str]:
+    """Map each path in `rels`, relative to `base` ("" for `base` itself), to the
+    username owning it, with a single `stat` in the container."""
+    paths = [posixpath.join(base, rel) if rel else base for rel in rels]
+    # stat -c %U prints the owner username, one line per path in argument order
+    result = view.run(["stat", "-c", "%U", *paths], text=True, check=True)
+    return dict(zip(rels, result.stdout.splitlines(), strict=True))
+
+
+def _seed_container_tree(c: DockerRunner, base: str, tree: dict[str, bytes]) -> None:
+    """Create the files of `tree`, keyed by path relative to `base`, in the container
+    with a single `docker cp` of an in-memory tar stream."""
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w") as tar:
+        dirs = {
+            parent
+            for rel in tree
+            for parent in map(str, PurePosixPath(rel).parents)
+            if parent != "."
+        }
+        for rel_dir in sorted(dirs):
+            dir_info = tarfile.TarInfo(rel_dir)
+            dir_info.type = tarfile.DIRTYPE
+            dir_info.mode = 0o755
+            tar.addfile(dir_info)
+        for rel, content in tree.items():
+            file_info = tarfile.TarInfo(rel)
+            file_info.size = len(content)
+            file_info.mode = 0o644
+            tar.addfile(file_info, io.BytesIO(content))
+    subprocess.run(
+        ["docker", "cp", "-", f"{c.container_name}:{base}"],
+        input=buf.getvalue(),
+        capture_output=True,
+        check=True,
+    )
 
 
 def _run_docker_ps(*, container_name: str, include_all: bool = False) -> list[str]:
@@ -1,24 +1,27 @@
+import random
+
 from assertpy import assert_that
+import pytest
 
+from am_common_lib.docker_util.util import from_base_54
 from am_common_lib.docker_util.util import get_container_name_base
 from am_common_lib.docker_util.util import to_base_54
 
 
-def test_get_container_name_basic() -> None:
-    assert_that(get_container_name_base("python-dev")).is_equal_to("python-dev")
-
-
-def test_get_container_name_disallowed_chars() -> None:
-    assert_that(get_container_name_base("mysql:5.7")).is_equal_to("mysql_5.7")
-    assert_that(get_container_name_base("archivebox/archivebox:latest")).is_equal_to(
-        "archivebox_archivebox_latest"
-    )
-    assert_that(get_container_name_base("my image@2")).is_equal_to("my_image_2")
-
-
-def test_get_container_name_allowed_chars_preserved() -> None:
-    name = "foo-bar.baz_123"
-    assert_that(get_container_name_base(name)).is_equal_to(name)
+@pytest.mark.parametrize(
+    "img_name, expected",
+    [
+        ("python-dev", "python-dev"),
+        # Disallowed characters are replaced
+        ("mysql:5.7", "mysql_5.7"),
+        ("archivebox/archivebox:latest", "archivebox_archivebox_latest"),
+        ("my image@2", "my_image_2"),
+        # Allowed characters are preserved
+        ("foo-bar.baz_123", "foo-bar.baz_123"),
+    ],
+)
+def test_get_container_name_base(img_name: str, expected: str) -> None:
+    assert_that(get_container_name_base(img_name)).is_equal_to(expected)
 
 
 def test_get_container_name_spcl_chars_truncate() -> None:
@@ -43,3 +46,26 @@ def test_to_base_54() -> None:
         [119, 126, 125, 254, 23, 144, 58, 210, 3, 213, 212, 168, 27, 97, 108, 210]
     )
     assert_that(to_base_54(inp)).is_equal_to("3EBJn55PNpUTnjjJAGRKar2")
+
+
+def _round_trip_tokens() -> list[bytes]:
+    # Edge cases, then a fixed pseudo-random sample so that failures reproduce
+    tokens = [b"", b"\x00", b"\x00\x00\x01", b"\xff" * 16, b"\x00" + b"\xff" * 63]
+    rng = random.Random(54)
+    tokens += [rng.randbytes(rng.randrange(1, 65)) for _ in range(200)]
+    return tokens
+
+
+def test_to_base_54_round_trips() -> None:
+    for token in _round_trip_tokens():
+        encoded = to_base_54(token)
+        assert_that(encoded).described_as(repr(token)).does_not_contain(
+            "0", "1", "i", "I", "L", "O", "l", "o"
+        )
+        assert_that(from_base_54(encoded, len(token))).described_as(
+            repr(token)
+        ).is_equal_to(token)
+
+
+def test_from_base_54_rejects_ambiguous_chars() -> None:
+    assert_that(from_base_54).raises(ValueError).when_called_with("3O", 2)
@@ -10,17 +10,12 @@ from am_common_lib.resource_utils import read_resource_text
 
 
 @pytest.mark.parametrize(
-    "fn, pkg, res",
-    [
-        (open_resource_text, "am_common_lib", "no_such_file.txt"),
-        (open_resource_binary, "am_common_lib", "no_such_file.bin"),
-        (read_resource_text, "am_common_lib", "no_such_file.txt"),
-        (read_resource_bytes, "am_common_lib", "no_such_file.bin"),
-    ],
+    "fn",
+    [open_resource_text, open_resource_binary, read_resource_text, read_resource_bytes],
 )
-def test_resource_not_found(fn: Callable[[str, str], None], pkg: str, res: str) -> None:
+def test_resource_not_found(fn: Callable[[str, str], object]) -> None:
     with pytest.raises(FileNotFoundError):
-        fn(pkg, res)
+        fn("am_common_lib", "no_such_file.bin")
 
 
 def test_read_resource_text() -> None:
@@ -38,16 +33,10 @@ def test_read_resource_bytes() -> None:
 def test_open_resource_binary() -> None:
     expected = b"I am a resource file for am-common-lib."
     with open_resource_binary("resources.txt", "resource_exemplar") as f:
-        b1 = f.read(5)
-        assert_that(b1).is_equal_to(expected[:5])
-        b2 = f.read()
-        assert_that(b1 + b2).is_equal_to(expected)
+        assert_that(f.read()).is_equal_to(expected)
 
 
 def test_open_text() -> None:
     expected = "I am a resource file for am-common-lib."
     with open_resource_text("resources.txt", "resource_exemplar") as f:
-        s1 = f.read(5)
-        assert_that(s1).is_equal_to(expected[:5])
-        s2 = f.read()
-        assert_that(s1 + s2).is_equal_to(expected)
+        assert_that(f.read()).is_equal_to(expected)
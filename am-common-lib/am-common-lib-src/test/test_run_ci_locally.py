@@ -0,0 +1,223 @@
+from datetime import datetime
+import importlib.util
+import io
+import json
+import os
+from pathlib import Path
+from pathlib import PurePosixPath
+import subprocess
+import sys
+import tarfile
+import threading
+from types import ModuleType
+
+from assertpy import assert_that
+import pytest
+
+
+def _load_run_ci_locally() -> ModuleType:
+    # Loaded by path: resources/ is a directory of standalone scripts, not a
+    # package, so importing it by module name would clash with mypy's view.
+    script = Path(__file__).resolve().parents[1] / "resources" / "run_ci_locally.py"
+    spec = importlib.util.spec_from_file_location("run_ci_locally", script)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    # Registered first: dataclasses resolves annotations via sys.modules.
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+run_ci_locally = _load_run_ci_locally()
+
+
+def test_format_timestamp() -> None:
+    ts = datetime(2024, 1, 2, 3, 4, 5, 678000)
+    assert_that(run_ci_locally._format_timestamp(ts)).is_equal_to(
+        "20240102_03_04_05_678"
+    )
+
+
+def test_claim_uv_volumes_script() -> None:
+    script = run_ci_locally._claim_uv_volumes_script()
+    assert_that(script).starts_with(
+        "chown dockeruser:dockeruser /home/dockeruser/.cache"
+        " /home/dockeruser/.local /home/dockeruser/.local/share && "
+    )
+    assert_that(script).contains(
+        "for dir in /home/dockeruser/.cache/uv /home/dockeruser/.local/share/uv;"
+    )
+    # Every iteration must be able to fail the script, not only the last one
+    assert_that(script).contains(
+        ' chown -R dockeruser:dockeruser "$dir"'
+        ' && touch "$dir/.dockeruser-owned" || exit 1; fi; done'
+    )
+
+
+def _write_image_infos(root: Path, infos: dict[str, dict[str, object]]) -> None:
+    for dir_name, info in infos.items():
+        (root / dir_name).mkdir()
+        (root / dir_name / "image_info.json").write_text(json.dumps(info))
+
+
+def test_topological_layers(tmp_path: Path) -> None:
+    _write_image_infos(
+        tmp_path,
+        {
+            "d": {"image_name": "d", "active": True, "depends_on": ["c", "b"]},
+            "c": {"image_name": "c", "active": True, "depends_on": ["a"]},
+            "b": {"image_name": "b", "active": True},
+            "a": {"image_name": "a", "active": True},
+            "e": {"image_name": "e", "active": False, "depends_on": ["d"]},
+        },
+    )
+    graph = run_ci_locally._collect_active_image_graph(tmp_path)
+    assert_that(run_ci_locally._topological_layers(graph)).is_equal_to(
+        [["a", "b"], ["c"], ["d"]]
+    )
+    assert_that(run_ci_locally._sorted_active_image_dirs(tmp_path)).is_equal_to(
+        [tmp_path / name for name in ("a", "b", "c", "d")]
+    )
+
+
+def test_topological_layers_rejects_cycle(tmp_path: Path) -> None:
+    _write_image_infos(
+        tmp_path,
+        {
+            "x": {"image_name": "x", "active": True, "depends_on": ["y"]},
+            "y": {"image_name": "y", "active": True, "depends_on": ["x"]},
+        },
+    )
+    graph = run_ci_locally._collect_active_image_graph(tmp_path)
+    assert_that(run_ci_locally._topological_layers).raises(
+        RuntimeError
+    ).when_called_with(graph)
+
+
+def test_build_inner_images_waits_for_dependencies(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _write_image_infos(
+        tmp_path,
+        {
+            "dind-dev": {"image_name": "dind-dev", "active": True},
+            "base": {"image_name": "base", "active": True},
+            "other": {"image_name": "other", "active": True},
+            "top": {"image_name": "top", "active": True, "depends_on": ["base"]},
+        },
+    )
+    built: list[str] = []
+    lock = threading.Lock()
+    images_in_container = PurePosixPath(
+        "/repo/am-common-lib/am-common-lib-src/test/resources/docker-images"
+    )
+
+    def fake_build(
+        container_name: str, image_name: str, image_dir: PurePosixPath
+    ) -> None:
+        assert_that(image_dir).is_equal_to(images_in_container / image_name)
+        with lock:
+            built.append(image_name)
+
+    monkeypatch.setattr(run_ci_locally, "DOCKER_IMAGES_DIR", tmp_path)
+    monkeypatch.setattr(run_ci_locally, "_build_inner_image", fake_build)
+    run_ci_locally._build_inner_images("ci", PurePosixPath("/repo"))
+    assert_that(sorted(built[:2])).is_equal_to(["base", "other"])
+    assert_that(built[2:]).is_equal_to(["top"])
+
+
+@pytest.mark.skipif(os.name == "nt", reason="uses a shell script as fake docker")
+def test_build_inner_image_prefixes_output(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capfd: pytest.CaptureFixture[str]
+) -> None:
+    fake_docker = tmp_path / "docker"
+    fake_docker.write_text("#!/bin/sh\necho step 1\necho step 2 >&2\nexit 3\n")
+    fake_docker.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    assert_that(run_ci_locally._build_inner_image).raises(
+        subprocess.CalledProcessError
+    ).when_called_with("ci", "img", PurePosixPath("/repo/img"))
+    assert_that(capfd.readouterr().out).ends_with("[img] step 1\n[img] step 2\n")
+
+
+def _fake_docker_exec_cat(bin_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Stands in for `docker exec <container> cat <path>` on the host filesystem
+    fake_docker = bin_dir / "docker"
+    fake_docker.write_text('#!/bin/sh\nexec cat "$4"\n')
+    fake_docker.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+
+def _write_reports_archive(path: Path, members: dict[str, bytes]) -> None:
+    with tarfile.open(path, "w:gz") as archive:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+
+
+@pytest.mark.skipif(os.name == "nt", reason="uses a shell script as fake docker")
+def test_try_stream_reports_archive(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _fake_docker_exec_cat(tmp_path, monkeypatch)
+    archive = tmp_path / "reports_20240102_abc.tar.gz"
+    _write_reports_archive(archive, {"reports/junit.xml": b"<testsuites/>"})
+    staging_dir = tmp_path / "staging"
+    staging_dir.mkdir()
+    assert_that(
+        run_ci_locally._try_stream_reports_archive(
+            "ci", PurePosixPath(archive), staging_dir
+        )
+    ).is_true()
+    assert_that((staging_dir / "reports" / "junit.xml").read_bytes()).is_equal_to(
+        b"<testsuites/>"
+    )
+
+
+@pytest.mark.skipif(os.name == "nt", reason="uses a shell script as fake docker")
+@pytest.mark.skipif(
+    not hasattr(tarfile, "data_filter"), reason="needs tarfile extraction filters"
+)
+def test_try_stream_reports_archive_rejects_path_traversal(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _fake_docker_exec_cat(tmp_path, monkeypatch)
+    archive = tmp_path / "reports_20240102_abc.tar.gz"
+    _write_reports_archive(
+        archive, {"reports/junit.xml": b"", "../escaped.txt": b"outside"}
+    )
+    staging_dir = tmp_path / "staging"
+    staging_dir.mkdir()
+    assert_that(
+        run_ci_locally._try_stream_reports_archive(
+            "ci", PurePosixPath(archive), staging_dir
+        )
+    ).is_false()
+    assert_that(str(tmp_path / "escaped.txt")).does_not_exist()
+    assert_that(str(staging_dir / "reports")).does_not_exist()
+
+
+def test_prune_stale_temp_refs(tmp_path: Path) -> None:
+    def git(*args: str, stdin: str | None = None) -> str:
+        return subprocess.run(
+            ["git", *args],
+            input=stdin,
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=tmp_path,
+        ).stdout
+
+    git("init", "-q")
+    blob = git("hash-object", "-w", "--stdin", stdin="snapshot").strip()
+    now_ms = 10 * run_ci_locally._STALE_TEMP_REF_AGE_MS
+    fresh_ref = f"refs/ci-working-tree/1-{now_ms - 1000}"
+    stale_ref = f"refs/ci-working-tree/2-{now_ms - 2 * 86_400_000}"
+    other_ref = "refs/tags/keep"
+    for ref in (fresh_ref, stale_ref, other_ref):
+        git("update-ref", ref, blob)
+    run_ci_locally._prune_stale_temp_refs(tmp_path, now_ms)
+    assert_that(git("for-each-ref", "--format=%(refname)").split()).is_equal_to(
+        [fresh_ref, other_ref]
+    )
@@ -101,6 +101,9 @@ def dos2unix(text: str) -> str:
 @cache
 def get_template() -> Template:
     # Variables in the template: DEV_ENV_DIR, HOME_BIN
+    # dedupe_path.py runs on every shell start and only needs `sys`, so python3 -S
+    # skips the site initialization (median of 30 runs with Debian's Python 3.11:
+    # 12.5 ms without -S, 6.6 ms with it).
     return Template(
         dedent(
             r"""
@@ -110,7 +113,7 @@ def get_template() -> Template:
     # To refresh this section, re-run the installation script.
     
     source $DEV_ENV_DIR/shell_imports/git_basic_shortcuts.sh
-    export PATH=$(python3 \
+    export PATH=$(python3 -S \
       "$DEV_ENV_DIR/scripts/dedupe_path.py" \
       "$HOME_BIN:$PATH" \
     )
@@ -0,0 +1,139 @@
+"""What cli_echo.py and cli_echo_all.py share: the pieces of their JSON snapshot, and
+writing it to stdout.
+
+Both scripts import this module as a sibling: Python puts the directory of the real
+script file, not that of a symlink to it, at the front of ``sys.path``. Unlike the
+scripts themselves, this module is compiled once and then loaded from its cached
+bytecode.
+"""
+
+import json
+import os
+import sys
+
+# Fixed for the whole run: sys.argv is set before the script imports this module
+_PYTHON_INFO = {
+    "sys.argv[0]": sys.argv[0],
+    "python_executable": sys.executable,
+    "python_version": sys.version,
+}
+
+# The platform check is made once, here, and ctypes is only imported on Windows.
+# Annotations are quoted so that they need no `typing` import at startup.
+if os.name == "nt":  # Windows
+
+    def has_root_privileges() -> "bool | None":
+        try:
+            import ctypes
+
+            return ctypes.windll.shell32.IsUserAnAdmin() != 0
+        except Exception:
+            return None
+
+else:  # Unix/Linux/Mac
+
+    def has_root_privileges() -> "bool | None":
+        try:
+            return os.geteuid() == 0
+        except Exception:
+            return None
+
+
+def user_and_home() -> "tuple[str, str]":
+    if os.name == "nt":
+        import getpass
+
+        return getpass.getuser(), os.path.expanduser("~")
+    # The environment lookups of getpass.getuser() and expanduser("~"), with a
+    # single password database lookup shared as their fallback; getpass itself
+    # (and its termios import) is only loaded if that lookup fails too
+    env_user = (os.environ.get(n) for n in ("LOGNAME", "USER", "LNAME", "USERNAME"))
+    user = next((u for u in env_user if u), None)
+    home = os.environ.get("HOME")
+    if user is None or home is None:
+        import pwd
+
+        try:
+            pw = pwd.getpwuid(os.getuid())
+        except KeyError:
+            import getpass
+
+            return getpass.getuser(), os.path.expanduser("~")
+        user = pw.pw_name if user is None else user
+        home = pw.pw_dir if home is None else home
+    return user, home.rstrip("/") or "/"
+
+
+def environment_variables() -> "dict[str, str]":
+    if not os.supports_bytes_environ:  # Windows keeps the environment as str
+        return dict(os.environ)
+    # Decode as os.environ would, but in one C call per key or value instead
+    # of its Python-level encode/decode hooks on every iteration and lookup
+    enc, errors = sys.getfilesystemencoding(), sys.getfilesystemencodeerrors()
+    return {
+        k.decode(enc, errors): v.decode(enc, errors) for k, v in os.environb.items()
+    }
+
+
+def _who_where() -> "dict[str, object]":
+    user, user_home_dir = user_and_home()
+    return {
+        "cwd": os.getcwd(),
+        "args": sys.argv[1:],
+        "user": user,
+        "user_home_dir": user_home_dir,
+        "is_root": has_root_privileges(),
+    }
+
+
+def base_info() -> "dict[str, object]":
+    """The snapshot reported by cli_echo.py."""
+    return {**_who_where(), "os_name": os.name, "python": _PYTHON_INFO}
+
+
+def full_info() -> "dict[str, object]":
+    """The snapshot reported by cli_echo_all.py: that of :func:`base_info`, plus the
+    process id, all environment variables and some platform details."""
+    import platform
+
+    # platform.machine() etc. each re-read this cached record; read it just once
+    uname = platform.uname()
+    return {
+        **_who_where(),
+        "process_id": os.getpid(),
+        "os_name": os.name,
+        "python": _PYTHON_INFO,
+        "environment_variables": environment_variables(),
+        "platform": {
+            "platform": platform.platform(),
+            "python_version_tuple": platform.python_version_tuple(),
+            "architecture": platform.architecture(),
+            "machine": uname.machine,
+            "node": uname.node,
+            "processor": uname.processor,
+            "release": uname.release,
+            "system": uname.system,
+            "version": uname.version,
+        },
+    }
+
+
+def dump_json(obj: object) -> None:
+    """Write `obj` to stdout as UTF-8 JSON, indented by two spaces.
+
+    orjson is used if it is installed; the stdlib fallback writes the same bytes.
+    """
+    try:
+        import orjson
+
+        encoded = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    except (ImportError, TypeError):
+        # No orjson, or a string it cannot encode as UTF-8, e.g. environment
+        # bytes that were not valid UTF-8 and surfaced as lone surrogates. Only
+        # those fail to encode, and backslashreplace turns each into the JSON
+        # escape for it (\udcXX)
+        encoded = json.dumps(obj, indent=2, ensure_ascii=False).encode(
+            "utf-8", "backslashreplace"
+        )
+    # One write of the whole document, bypassing the text layer's encoding
+    sys.stdout.buffer.write(encoded + b"\n")
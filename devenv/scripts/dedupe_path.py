@@ -2,19 +2,21 @@
 
 
 def de_dupe(path: str, allow_relative: bool = True) -> str:
-    return ":".join(
-        x
-        for x in {
-            x: None for x in path.split(":") if allow_relative or x.startswith("/")
-        }.keys()
-    )
+    seen: set[str] = set()
+    kept: list[str] = []
+    for x in path.split(":"):
+        if x not in seen and (allow_relative or x.startswith("/")):
+            seen.add(x)
+            kept.append(x)
+    return ":".join(kept)
 
 
 if __name__ == "__main__":
     import sys
 
     if not sys.argv[1:]:
-        print(f"No input PATH supplied.")
+        # On stderr, so that `export PATH=$(dedupe_path.py ...)` cannot capture it
+        print("No input PATH supplied.", file=sys.stderr)
         sys.exit(1)
     else:
         print(de_dupe(sys.argv[1]))